@@ -1,7 +1,19 @@
-from .core.client import SlurmJob, SSHSlurmClient
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .core.client import SlurmJob, SSHSlurmClient
 
 __all__ = ["SSHSlurmClient", "SlurmJob"]
 
 
+def __getattr__(name: str):
+    # Resolve the client lazily so the CLI can start without importing paramiko
+    if name in __all__:
+        from .core import client
+
+        return getattr(client, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def hello() -> str:
     return "Hello from ssh-sbatch!"
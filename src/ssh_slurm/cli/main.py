@@ -1,95 +1,347 @@
 #!/usr/bin/env python3
 
-import argparse
 import sys
+from typing import TYPE_CHECKING
 
+if TYPE_CHECKING:
+    import argparse
 
-def main():
-    """Main CLI entry point with clean subcommand routing"""
+    from .parsing import Schema
 
-    # Check if first argument is 'profile' - if so, handle profile commands
-    if len(sys.argv) > 1 and sys.argv[1] == "profile":
-        from .profile import handle_profile_command
+# Pre-rendered help output so that `ssb --help` and `ssb profile --help` can be
+# answered without importing or building argparse. Rendered at 80 columns by
+# Python 3.13 and checked against argparse in tests/test_cli.py; regenerate
+# after changing any flags with:
+#   COLUMNS=80 python -c "import sys; sys.argv = ['ssb']; \
+#     from ssh_slurm.cli.submit import _build_parser; \
+#     print(_build_parser(grouped=True).format_help(), end='')"
+# (and `_build_profile_parser([])` from this module for _PROFILE_HELP)
+_HELP = """\
+usage: ssb [-h] [--host HOST] [--profile PROFILE] [--hostname HOSTNAME]
+           [--username USERNAME] [--key-file KEY_FILE] [--port PORT]
+           [--config CONFIG] [--ssh-config SSH_CONFIG] [--job-name JOB_NAME]
+           [--poll-interval POLL_INTERVAL] [--timeout TIMEOUT] [--no-monitor]
+           [--no-cleanup] [--env KEY=VALUE] [--env-local KEY] [--verbose]
+           script_path
 
-        # Create profile parser
-        parser = argparse.ArgumentParser(
-            prog="ssb profile", description="Manage SSH SLURM server profiles"
-        )
-        parser.add_argument(
-            "--config", help="Config file path (default: ~/.config/ssh-slurm.json)"
-        )
+Submit and monitor SLURM jobs via SSH
 
-        subparsers = parser.add_subparsers(
-            dest="profile_command", help="Profile commands"
-        )
+positional arguments:
+  script_path           Path to sbatch script file
 
-        # Add profile subcommands
-        add_parser = subparsers.add_parser("add", help="Add a new profile")
-        add_parser.add_argument("name", help="Profile name")
-        add_parser.add_argument(
-            "--ssh-host", help="SSH config host name (from ~/.ssh/config)"
-        )
+options:
+  -h, --help            show this help message and exit
+  --verbose, -v         Enable verbose logging
+
+Connection options:
+  --host, -H HOST       SSH host from .ssh/config
+  --profile, -p PROFILE
+                        Use saved profile
+  --hostname HOSTNAME   DGX server hostname
+  --username USERNAME   SSH username
+  --key-file KEY_FILE   SSH private key file path
+  --port PORT           SSH port (default: 22)
+  --config CONFIG       Config file path (default: ~/.config/ssh-slurm.json)
+  --ssh-config SSH_CONFIG
+                        SSH config file path (default: ~/.ssh/config)
+
+Job options:
+  --job-name JOB_NAME   Job name
+  --poll-interval, -i POLL_INTERVAL
+                        Job status polling interval in seconds (default: 10)
+  --timeout TIMEOUT     Job monitoring timeout in seconds
+  --no-monitor          Submit job without monitoring
+  --no-cleanup          Do not cleanup uploaded script files
+
+Environment options:
+  --env KEY=VALUE       Pass environment variable to remote job (can be used
+                        multiple times)
+  --env-local KEY       Pass local environment variable to remote job (can be
+                        used multiple times)
+"""
+
+_PROFILE_HELP = """\
+usage: ssb profile [-h] [--config CONFIG]
+                   {add,remove,list,set,show,update,env} ...
+
+Manage SSH SLURM server profiles
+
+positional arguments:
+  {add,remove,list,set,show,update,env}
+                        Profile commands
+    add                 Add a new profile
+    remove              Remove a profile
+    list                List all profiles
+    set                 Set current profile
+    show                Show profile details
+    update              Update a profile
+    env                 Manage environment variables for a profile
+
+options:
+  -h, --help            show this help message and exit
+  --config CONFIG       Config file path (default: ~/.config/ssh-slurm.json)
+"""
+
+_HELP_FLAGS = ("-h", "--help")
 
-        # Direct connection parameters group
-        direct_group = add_parser.add_argument_group(
+# _HELP matches argparse from Python 3.13 on; older versions render aliased
+# options as "--host HOST, -H HOST", so they fall back to argparse
+_HELP_IS_CURRENT = sys.version_info >= (3, 13)
+
+# Static schema for the profile fast path; keep in sync with the _build_*_parser
+# functions below (see parsing.parse_static for the layout)
+_NAME = (("name", True),)
+_PROFILE_SCHEMA: "Schema" = (
+    ((("--config",), "config", "str", None),),
+    (),
+    "profile_command",
+    (
+        (
+            "add",
+            (
+                (
+                    (("--ssh-host",), "ssh_host", "str", None),
+                    (("--hostname",), "hostname", "str", None),
+                    (("--username",), "username", "str", None),
+                    (("--key-file",), "key_file", "str", None),
+                    (("--port",), "port", "int", 22),
+                    (("--description",), "description", "str", None),
+                ),
+                _NAME,
+                None,
+                (),
+            ),
+        ),
+        ("remove", ((), _NAME, None, ())),
+        ("list", ((), (), None, ())),
+        ("set", ((), _NAME, None, ())),
+        ("show", ((), (("name", False),), None, ())),
+        (
+            "update",
+            (
+                (
+                    (("--ssh-host",), "ssh_host", "str", None),
+                    (("--hostname",), "hostname", "str", None),
+                    (("--username",), "username", "str", None),
+                    (("--key-file",), "key_file", "str", None),
+                    (("--port",), "port", "int", None),
+                    (("--description",), "description", "str", None),
+                ),
+                _NAME,
+                None,
+                (),
+            ),
+        ),
+        (
+            "env",
+            (
+                (),
+                _NAME,
+                "env_command",
+                (
+                    ("set", ((), (("key", True), ("value", True)), None, ())),
+                    ("unset", ((), (("key", True),), None, ())),
+                    ("list", ((), (), None, ())),
+                ),
+            ),
+        ),
+    ),
+)
+
+# Top-level profile options that consume the following token as their value
+_PROFILE_VALUE_OPTIONS = ("--config",)
+
+
+def _positionals(argv: list[str]) -> list[str]:
+    """Return the positional tokens in argv, skipping options and their values"""
+    positionals = []
+    skip_next = False
+    for token in argv:
+        if skip_next:
+            skip_next = False
+        elif token in _PROFILE_VALUE_OPTIONS:
+            skip_next = True
+        elif not token.startswith("-"):
+            positionals.append(token)
+    return positionals
+
+
+def _sniff_subcommand(argv: list[str]) -> str | None:
+    """Return the requested subcommand (first positional token) in argv"""
+    positionals = _positionals(argv)
+    return positionals[0] if positionals else None
+
+
+def _build_add_parser(subparsers, grouped: bool = True) -> None:
+    add_parser = subparsers.add_parser("add", help="Add a new profile")
+    add_parser.add_argument("name", help="Profile name")
+    add_parser.add_argument(
+        "--ssh-host", help="SSH config host name (from ~/.ssh/config)"
+    )
+
+    # Direct connection parameters group
+    direct_group = (
+        add_parser.add_argument_group(
             "Direct connection (use when not using --ssh-host)"
         )
-        direct_group.add_argument("--hostname", help="Server hostname")
-        direct_group.add_argument("--username", help="SSH username")
-        direct_group.add_argument("--key-file", help="SSH private key file path")
-        direct_group.add_argument(
-            "--port", type=int, default=22, help="SSH port (default: 22)"
-        )
-        add_parser.add_argument("--description", help="Profile description")
+        if grouped
+        else add_parser
+    )
+    direct_group.add_argument("--hostname", help="Server hostname")
+    direct_group.add_argument("--username", help="SSH username")
+    direct_group.add_argument("--key-file", help="SSH private key file path")
+    direct_group.add_argument(
+        "--port", type=int, default=22, help="SSH port (default: 22)"
+    )
+    add_parser.add_argument("--description", help="Profile description")
 
-        # Other profile subcommands
-        remove_parser = subparsers.add_parser("remove", help="Remove a profile")
-        remove_parser.add_argument("name", help="Profile name")
 
-        subparsers.add_parser("list", help="List all profiles")
+def _build_remove_parser(subparsers) -> None:
+    remove_parser = subparsers.add_parser("remove", help="Remove a profile")
+    remove_parser.add_argument("name", help="Profile name")
 
-        set_parser = subparsers.add_parser("set", help="Set current profile")
-        set_parser.add_argument("name", help="Profile name")
 
-        show_parser = subparsers.add_parser("show", help="Show profile details")
-        show_parser.add_argument(
-            "name", nargs="?", help="Profile name (default: current)"
-        )
+def _build_list_parser(subparsers) -> None:
+    subparsers.add_parser("list", help="List all profiles")
 
-        update_parser = subparsers.add_parser("update", help="Update a profile")
-        update_parser.add_argument("name", help="Profile name")
-        update_parser.add_argument("--ssh-host", help="SSH config host name")
-        update_parser.add_argument("--hostname", help="Server hostname")
-        update_parser.add_argument("--username", help="SSH username")
-        update_parser.add_argument("--key-file", help="SSH private key file path")
-        update_parser.add_argument("--port", type=int, help="SSH port")
-        update_parser.add_argument("--description", help="Profile description")
-
-        # Environment variable management
-        env_parser = subparsers.add_parser(
-            "env", help="Manage environment variables for a profile"
-        )
-        env_parser.add_argument("name", help="Profile name")
-        env_subparsers = env_parser.add_subparsers(
-            dest="env_command", help="Environment variable commands"
-        )
 
-        env_set_parser = env_subparsers.add_parser(
-            "set", help="Set environment variable"
-        )
-        env_set_parser.add_argument("key", help="Environment variable name")
-        env_set_parser.add_argument("value", help="Environment variable value")
+def _build_set_parser(subparsers) -> None:
+    set_parser = subparsers.add_parser("set", help="Set current profile")
+    set_parser.add_argument("name", help="Profile name")
 
-        env_unset_parser = env_subparsers.add_parser(
-            "unset", help="Unset environment variable"
-        )
-        env_unset_parser.add_argument("key", help="Environment variable name")
 
-        env_subparsers.add_parser("list", help="List environment variables")
+def _build_show_parser(subparsers) -> None:
+    show_parser = subparsers.add_parser("show", help="Show profile details")
+    show_parser.add_argument("name", nargs="?", help="Profile name (default: current)")
+
+
+def _build_update_parser(subparsers) -> None:
+    update_parser = subparsers.add_parser("update", help="Update a profile")
+    update_parser.add_argument("name", help="Profile name")
+    update_parser.add_argument("--ssh-host", help="SSH config host name")
+    update_parser.add_argument("--hostname", help="Server hostname")
+    update_parser.add_argument("--username", help="SSH username")
+    update_parser.add_argument("--key-file", help="SSH private key file path")
+    update_parser.add_argument("--port", type=int, help="SSH port")
+    update_parser.add_argument("--description", help="Profile description")
+
+
+def _build_env_set_parser(env_subparsers) -> None:
+    env_set_parser = env_subparsers.add_parser("set", help="Set environment variable")
+    env_set_parser.add_argument("key", help="Environment variable name")
+    env_set_parser.add_argument("value", help="Environment variable value")
+
+
+def _build_env_unset_parser(env_subparsers) -> None:
+    env_unset_parser = env_subparsers.add_parser(
+        "unset", help="Unset environment variable"
+    )
+    env_unset_parser.add_argument("key", help="Environment variable name")
+
+
+def _build_env_list_parser(env_subparsers) -> None:
+    env_subparsers.add_parser("list", help="List environment variables")
+
+
+_ENV_BUILDERS = {
+    "set": _build_env_set_parser,
+    "unset": _build_env_unset_parser,
+    "list": _build_env_list_parser,
+}
+
+
+def _build_env_parser(subparsers, argv: list[str]) -> None:
+    env_parser = subparsers.add_parser(
+        "env", help="Manage environment variables for a profile"
+    )
+    env_parser.add_argument("name", help="Profile name")
+    env_subparsers = env_parser.add_subparsers(
+        dest="env_command", help="Environment variable commands"
+    )
+
+    # Positionals after "env" are: <name> <env_command> ...
+    positionals = _positionals(argv)
+    env_command = positionals[2] if len(positionals) > 2 else None
+    if env_command in _ENV_BUILDERS:
+        _ENV_BUILDERS[env_command](env_subparsers)
+    else:
+        for build in _ENV_BUILDERS.values():
+            build(env_subparsers)
+
+
+_PROFILE_BUILDERS = {
+    "add": _build_add_parser,
+    "remove": _build_remove_parser,
+    "list": _build_list_parser,
+    "set": _build_set_parser,
+    "show": _build_show_parser,
+    "update": _build_update_parser,
+}
+
+
+def _build_profile_parser(argv: list[str]) -> "argparse.ArgumentParser":
+    """Build the profile parser, constructing only the requested subcommand branch"""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="ssb profile", description="Manage SSH SLURM server profiles"
+    )
+    parser.add_argument(
+        "--config", help="Config file path (default: ~/.config/ssh-slurm.json)"
+    )
+
+    subparsers = parser.add_subparsers(dest="profile_command", help="Profile commands")
+
+    # Build every subcommand when help was requested or none (or an unknown
+    # one) was given, so that usage lines, help output and "invalid choice"
+    # errors stay complete
+    help_requested = any(token in _HELP_FLAGS for token in argv)
+    command = None if help_requested else _sniff_subcommand(argv)
+    if command == "env":
+        _build_env_parser(subparsers, argv)
+    elif command == "add":
+        # The argument group only changes --help layout
+        _build_add_parser(subparsers, grouped=False)
+    elif command in _PROFILE_BUILDERS:
+        _PROFILE_BUILDERS[command](subparsers)
+    else:
+        for build in _PROFILE_BUILDERS.values():
+            build(subparsers)
+        _build_env_parser(subparsers, [])
+
+    return parser
+
+
+def main():
+    """Main CLI entry point with clean subcommand routing"""
+    argv = sys.argv[1:]
+
+    # Answer bare help requests from the pre-rendered text
+    if len(argv) == 1 and argv[0] in _HELP_FLAGS and _HELP_IS_CURRENT:
+        sys.stdout.write(_HELP)
+        return
+    if len(argv) == 2 and argv[0] == "profile" and argv[1] in _HELP_FLAGS:
+        sys.stdout.write(_PROFILE_HELP)
+        return
+
+    # Check if first argument is 'profile' - if so, handle profile commands
+    if len(sys.argv) > 1 and sys.argv[1] == "profile":
+        from .parsing import parse_static
+        from .profile import handle_profile_command
+
+        profile_argv = sys.argv[2:]
+        values = parse_static(profile_argv, _PROFILE_SCHEMA)
+        if values is not None:
+            from types import SimpleNamespace
+
+            args = SimpleNamespace(**values)
+        else:
+            # Help requests and malformed input go through argparse
+            parser = _build_profile_parser(profile_argv)
 
-        # Remove 'profile' from argv and parse
-        sys.argv = ["ssb profile"] + sys.argv[2:]
-        args = parser.parse_args()
+            # Remove 'profile' from argv and parse
+            sys.argv = ["ssb profile"] + profile_argv
+            args = parser.parse_args()
         handle_profile_command(args)
         return
 
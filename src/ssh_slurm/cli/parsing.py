@@ -0,0 +1,94 @@
+"""Table-driven argument parsing for the common CLI paths (argparse stays the
+fallback for help output and malformed input)"""
+
+# A schema is (options, positionals, subcommand_dest, subcommands):
+#   options:      tuple of (flags, dest, kind, default), kind in
+#                 "str" / "int" / "flag" / "append"
+#   positionals:  tuple of (dest, required)
+#   subcommands:  tuple of (name, schema), selected into subcommand_dest
+
+from typing import Any
+
+Option = tuple[tuple[str, ...], str, str, Any]
+Schema = tuple[tuple[Option, ...], tuple[tuple[str, bool], ...], str | None, tuple]
+
+
+def parse_static(argv: list[str], schema: Schema) -> dict[str, Any] | None:
+    """Parse argv against a static schema, returning None to defer to argparse"""
+    return _parse(argv, schema, {})
+
+
+def _parse(argv: list[str], schema: Schema, values: dict[str, Any]) -> dict | None:
+    options, positionals, subcommand_dest, subcommands = schema
+
+    table = {}
+    for flags, dest, kind, default in options:
+        values[dest] = default
+        for flag in flags:
+            table[flag] = (dest, kind)
+    for dest, _required in positionals:
+        values[dest] = None
+    if subcommand_dest:
+        values[subcommand_dest] = None
+
+    filled = 0
+    i = 0
+    n = len(argv)
+    while i < n:
+        token = argv[i]
+        i += 1
+
+        if not token.startswith("-") or token == "-":
+            if filled < len(positionals):
+                values[positionals[filled][0]] = token
+                filled += 1
+                continue
+            if not subcommand_dest:
+                return None
+            sub_schema = dict(subcommands).get(token)
+            if sub_schema is None:
+                return None
+            if not _required_filled(positionals, filled):
+                return None
+            values[subcommand_dest] = token
+            return _parse(argv[i:], sub_schema, values)
+
+        flag, sep, inline = token.partition("=")
+        option = table.get(flag if flag.startswith("--") else token)
+        if option is None:
+            return None
+        dest, kind = option
+
+        if kind == "flag":
+            if sep:
+                return None
+            values[dest] = True
+            continue
+
+        if sep and flag.startswith("--"):
+            value = inline
+        elif i < n and not argv[i].startswith("-"):
+            value = argv[i]
+            i += 1
+        else:
+            return None
+
+        if kind == "int":
+            try:
+                values[dest] = int(value)
+            except ValueError:
+                return None
+        elif kind == "append":
+            if values[dest] is None:
+                values[dest] = []
+            values[dest].append(value)
+        else:
+            values[dest] = value
+
+    if not _required_filled(positionals, filled):
+        return None
+    return values
+
+
+def _required_filled(positionals: tuple[tuple[str, bool], ...], filled: int) -> bool:
+    return all(not required for _dest, required in positionals[filled:])
@@ -272,11 +272,9 @@ def cmd_env(args, config_manager: ConfigManager):
 
 def cmd_env_set(args, config_manager: ConfigManager, profile):
     """Set an environment variable for a profile"""
-    if profile.env_vars is None:
-        profile.env_vars = {}
-
-    profile.env_vars[args.key] = args.value
-    config_manager.update_profile(args.name, env_vars=profile.env_vars)
+    env_vars = dict(profile.env_vars or {})
+    env_vars[args.key] = args.value
+    config_manager.update_profile(args.name, env_vars=env_vars)
     print(f"Environment variable '{args.key}' set for profile '{args.name}'")
 
 
@@ -289,8 +287,9 @@ def cmd_env_unset(args, config_manager: ConfigManager, profile):
         )
         sys.exit(1)
 
-    del profile.env_vars[args.key]
-    config_manager.update_profile(args.name, env_vars=profile.env_vars)
+    env_vars = dict(profile.env_vars)
+    del env_vars[args.key]
+    config_manager.update_profile(args.name, env_vars=env_vars)
     print(f"Environment variable '{args.key}' removed from profile '{args.name}'")
 
 
@@ -1,10 +1,19 @@
 #!/usr/bin/env python3
 
-import argparse
-import logging
+# Opt-in for explicit lazy imports (PEP 810, Python 3.15+): the rich renderers
+# are only needed once a job has been submitted. Ignored on older Pythons.
+__lazy_modules__ = [
+    "rich.live",
+    "rich.panel",
+    "rich.progress",
+    "rich.status",
+    "rich.syntax",
+    "rich.text",
+]
+
 import sys
 import time
-from pathlib import Path
+from typing import TYPE_CHECKING
 
 from rich.console import Console, RenderableType
 from rich.live import Live
@@ -14,21 +23,57 @@ from rich.status import Status
 from rich.syntax import Syntax
 from rich.text import Text
 
-from ..core.client import SSHSlurmClient
-from ..core.config import ConfigManager
-from ..core.ssh_config import get_ssh_config_host
+if TYPE_CHECKING:
+    import argparse
+    from types import SimpleNamespace
+
+    from ..core.client import SSHSlurmClient
+    from .parsing import Schema
 
 console = Console()
 
+# Environment variables forwarded to the remote job automatically when set
+_COMMON_ENV = (
+    "HF_TOKEN",
+    "HUGGING_FACE_HUB_TOKEN",
+    "WANDB_API_KEY",
+    "WANDB_ENTITY",
+    "WANDB_PROJECT",
+    "OPENAI_API_KEY",
+    "ANTHROPIC_API_KEY",
+    "CUDA_VISIBLE_DEVICES",
+    "HF_HOME",
+    "HF_HUB_CACHE",
+    "TRANSFORMERS_CACHE",
+    "TORCH_HOME",
+    "SLURM_LOG_DIR",  # Important for log file location
+)
+
 
 def setup_logging(verbose: bool = False):
-    level = (
-        logging.DEBUG if verbose else logging.WARNING
-    )  # Only show warnings and errors by default
-    logging.basicConfig(format="%(asctime)s - %(levelname)s - %(message)s", level=level)
+    # Without --verbose nothing is configured: status output goes through print,
+    # and warnings/errors still reach stderr via logging's last-resort handler
+    if not verbose:
+        return
 
+    import logging
+
+    logging.basicConfig(
+        format="%(asctime)s - %(levelname)s - %(message)s", level=logging.DEBUG
+    )
+
+
+def _build_parser(grouped: bool | None = None) -> "argparse.ArgumentParser":
+    """Build the full argparse parser (used for --help and malformed arguments)
+
+    Argument groups only affect --help layout, so they are created only when
+    help was requested (or grouped=True is passed explicitly).
+    """
+    import argparse
+
+    if grouped is None:
+        grouped = "-h" in sys.argv or "--help" in sys.argv
 
-def main():
     parser = argparse.ArgumentParser(
         description="Submit and monitor SLURM jobs via SSH"
     )
@@ -36,7 +81,7 @@ def main():
     parser.add_argument("script_path", help="Path to sbatch script file")
 
     # Connection options
-    conn_group = parser.add_argument_group("Connection options")
+    conn_group = parser.add_argument_group("Connection options") if grouped else parser
     conn_group.add_argument("--host", "-H", help="SSH host from .ssh/config")
     conn_group.add_argument("--profile", "-p", help="Use saved profile")
     conn_group.add_argument("--hostname", help="DGX server hostname")
@@ -53,7 +98,7 @@ def main():
     )
 
     # Job options
-    job_group = parser.add_argument_group("Job options")
+    job_group = parser.add_argument_group("Job options") if grouped else parser
     job_group.add_argument("--job-name", help="Job name")
     job_group.add_argument(
         "--poll-interval",
@@ -73,7 +118,7 @@ def main():
     )
 
     # Environment options
-    env_group = parser.add_argument_group("Environment options")
+    env_group = parser.add_argument_group("Environment options") if grouped else parser
     env_group.add_argument(
         "--env",
         action="append",
@@ -92,79 +137,134 @@ def main():
         "--verbose", "-v", action="store_true", help="Enable verbose logging"
     )
 
-    args = parser.parse_args()
+    return parser
+
+
+# Static schema for the fast path; keep in sync with _build_parser()
+_SUBMIT_SCHEMA: "Schema" = (
+    (
+        (("--host", "-H"), "host", "str", None),
+        (("--profile", "-p"), "profile", "str", None),
+        (("--hostname",), "hostname", "str", None),
+        (("--username",), "username", "str", None),
+        (("--key-file",), "key_file", "str", None),
+        (("--port",), "port", "int", 22),
+        (("--config",), "config", "str", None),
+        (("--ssh-config",), "ssh_config", "str", None),
+        (("--job-name",), "job_name", "str", None),
+        (("--poll-interval", "-i"), "poll_interval", "int", 10),
+        (("--timeout",), "timeout", "int", None),
+        (("--no-monitor",), "no_monitor", "flag", False),
+        (("--no-cleanup",), "no_cleanup", "flag", False),
+        (("--env",), "env", "append", None),
+        (("--env-local",), "env_local", "append", None),
+        (("--verbose", "-v"), "verbose", "flag", False),
+    ),
+    (("script_path", True),),
+    None,
+    (),
+)
+
+
+def _fast_parse(argv: list[str]) -> "SimpleNamespace | None":
+    """Parse submit arguments without building an argparse parser.
+
+    Returns None for anything out of the ordinary (help, unknown or abbreviated
+    options, missing values, bad integers) so that argparse can handle it and
+    produce its usual messages.
+    """
+    from types import SimpleNamespace
+
+    from .parsing import parse_static
+
+    values = parse_static(argv, _SUBMIT_SCHEMA)
+    if values is None:
+        return None
+    return SimpleNamespace(**values)
+
+
+def _params_from_ssh_host(host: str, ssh_config_path: str | None) -> dict:
+    """Build connection parameters from an SSH config host entry"""
+    # get_ssh_config_host reuses the parsed file until it changes on disk
+    from ..core.ssh_config import get_ssh_config_host
+
+    ssh_host = get_ssh_config_host(host, ssh_config_path)
+    if not ssh_host:
+        sys.stderr.write(f"Error: SSH host '{host}' not found\n")
+        sys.exit(1)
+
+    return {
+        "hostname": ssh_host.effective_hostname,
+        "username": ssh_host.effective_user,
+        "key_filename": ssh_host.effective_identity_file,
+        "port": ssh_host.effective_port,
+        "proxy_jump": ssh_host.proxy_jump,
+    }
+
+
+def _params_from_profile(profile, ssh_config_path: str | None) -> dict:
+    """Build connection parameters from a saved profile"""
+    if profile.ssh_host:
+        # Profile uses SSH config host
+        return _params_from_ssh_host(profile.ssh_host, ssh_config_path)
+
+    # Profile uses direct connection
+    return {
+        "hostname": profile.hostname,
+        "username": profile.username,
+        "key_filename": profile.key_filename,
+        "port": profile.port,
+    }
+
+
+def main():
+    _err = sys.stderr.write
+
+    args = _fast_parse(sys.argv[1:])
+    if args is None:
+        args = _build_parser().parse_args()
 
     setup_logging(args.verbose)
 
-    # Validate script path
-    script_path = Path(args.script_path).resolve()
-    if not script_path.exists():
-        print(f"Error: Script file '{script_path}' not found", file=sys.stderr)
-        sys.exit(1)
+    # Deferred until after argument parsing so --help and usage errors do not
+    # pay for importing paramiko and the rest of the core stack
+    import os
+    from pathlib import Path
+
+    from ..core.client import SSHSlurmClient
+    from ..core.config import ConfigManager
 
     # Determine connection parameters
     try:
-        config_manager = ConfigManager(args.config)
+        config_manager = ConfigManager(args.config, use_cache=True)
         connection_params = {}
         display_host = None  # For pretty display in connection message
 
         if args.host:
             # Use SSH config host
-            ssh_host = get_ssh_config_host(args.host, args.ssh_config)
-            if not ssh_host:
-                print(f"Error: SSH host '{args.host}' not found", file=sys.stderr)
-                sys.exit(1)
-
-            connection_params = {
-                "hostname": ssh_host.effective_hostname,
-                "username": ssh_host.effective_user,
-                "key_filename": ssh_host.effective_identity_file,
-                "port": ssh_host.effective_port,
-                "proxy_jump": ssh_host.proxy_jump,
-            }
+            connection_params = _params_from_ssh_host(args.host, args.ssh_config)
             display_host = args.host  # Use SSH config host name for display
 
         elif args.profile:
             # Use saved profile
             profile = config_manager.get_profile(args.profile)
             if not profile:
-                print(f"Error: Profile '{args.profile}' not found", file=sys.stderr)
+                _err(f"Error: Profile '{args.profile}' not found\n")
                 sys.exit(1)
 
+            connection_params = _params_from_profile(profile, args.ssh_config)
             if profile.ssh_host:
-                # Profile uses SSH config host
-                ssh_host = get_ssh_config_host(profile.ssh_host, args.ssh_config)
-                if not ssh_host:
-                    print(
-                        f"Error: SSH host '{profile.ssh_host}' not found",
-                        file=sys.stderr,
-                    )
-                    sys.exit(1)
-                connection_params = {
-                    "hostname": ssh_host.effective_hostname,
-                    "username": ssh_host.effective_user,
-                    "key_filename": ssh_host.effective_identity_file,
-                    "port": ssh_host.effective_port,
-                    "proxy_jump": ssh_host.proxy_jump,
-                }
                 display_host = (
                     f"{args.profile} ({profile.ssh_host})"  # Profile name with SSH host
                 )
             else:
-                # Profile uses direct connection
-                connection_params = {
-                    "hostname": profile.hostname,
-                    "username": profile.username,
-                    "key_filename": profile.key_filename,
-                    "port": profile.port,
-                }
                 display_host = args.profile  # Use profile name for display
 
-        elif all([args.hostname, args.username, args.key_file]):
+        elif args.hostname and args.username and args.key_file:
             # Use direct parameters
             key_path = config_manager.expand_path(args.key_file)
             if not Path(key_path).exists():
-                print(f"Error: SSH key file '{key_path}' not found", file=sys.stderr)
+                _err(f"Error: SSH key file '{key_path}' not found\n")
                 sys.exit(1)
 
             connection_params = {
@@ -178,52 +278,37 @@ def main():
             # Try current profile as fallback
             profile = config_manager.get_current_profile()
             if profile:
+                connection_params = _params_from_profile(profile, args.ssh_config)
                 if profile.ssh_host:
-                    # Profile uses SSH config host
-                    ssh_host = get_ssh_config_host(profile.ssh_host, args.ssh_config)
-                    if not ssh_host:
-                        print(
-                            f"Error: SSH host '{profile.ssh_host}' not found",
-                            file=sys.stderr,
-                        )
-                        sys.exit(1)
-                    connection_params = {
-                        "hostname": ssh_host.effective_hostname,
-                        "username": ssh_host.effective_user,
-                        "key_filename": ssh_host.effective_identity_file,
-                        "port": ssh_host.effective_port,
-                        "proxy_jump": ssh_host.proxy_jump,
-                    }
                     display_host = (
                         f"current ({profile.ssh_host})"  # Current profile with SSH host
                     )
                 else:
-                    # Profile uses direct connection
-                    connection_params = {
-                        "hostname": profile.hostname,
-                        "username": profile.username,
-                        "key_filename": profile.key_filename,
-                        "port": profile.port,
-                    }
                     display_host = "current"  # Current profile for direct connection
             else:
-                print("Error: No connection method specified", file=sys.stderr)
-                print(
-                    "Use --host, --profile, or provide --hostname/--username/--key-file",
-                    file=sys.stderr,
+                _err("Error: No connection method specified\n")
+                _err(
+                    "Use --host, --profile, or provide --hostname/--username/--key-file\n"
                 )
                 sys.exit(1)
 
-        # Process environment variables
-        import os
+        # Validate script path with a single stat; the remote side only needs
+        # the file contents, so symlinks are not resolved
+        script_path = os.path.abspath(args.script_path)
+        try:
+            os.stat(script_path)
+        except FileNotFoundError:
+            _err(f"Error: Script file '{script_path}' not found\n")
+            sys.exit(1)
 
+        # Process environment variables
         env_vars = {}
 
         # Add profile-specific environment variables first (if using profile)
         current_profile = None
         if args.profile:
             current_profile = config_manager.get_profile(args.profile)
-        elif not any([args.host, args.hostname]):
+        elif not (args.host or args.hostname):
             # Using current profile as fallback
             current_profile = config_manager.get_current_profile()
 
@@ -235,50 +320,34 @@ def main():
                 )
 
         # Auto-detect common environment variables
-        common_env_vars = [
-            "HF_TOKEN",
-            "HUGGING_FACE_HUB_TOKEN",
-            "WANDB_API_KEY",
-            "WANDB_ENTITY",
-            "WANDB_PROJECT",
-            "OPENAI_API_KEY",
-            "ANTHROPIC_API_KEY",
-            "CUDA_VISIBLE_DEVICES",
-            "HF_HOME",
-            "HF_HUB_CACHE",
-            "TRANSFORMERS_CACHE",
-            "TORCH_HOME",
-            "SLURM_LOG_DIR",  # Important for log file location
-        ]
-
-        for key in common_env_vars:
-            if key in os.environ:
-                env_vars[key] = os.environ[key]
-                if args.verbose:
-                    print(f"Auto-detected environment variable: {key}")
+        env = os.environ
+        detected_env_vars = {}
+        for key in _COMMON_ENV:
+            value = env.get(key)
+            if value is not None:
+                detected_env_vars[key] = value
+        env_vars.update(detected_env_vars)
+        if args.verbose:
+            for key in detected_env_vars:
+                print(f"Auto-detected environment variable: {key}")
 
         # Add explicitly provided environment variables
         if args.env:
             for env_var in args.env:
-                if "=" not in env_var:
-                    print(
-                        f"Error: Invalid environment variable format: {env_var}",
-                        file=sys.stderr,
-                    )
+                key, sep, value = env_var.partition("=")
+                if not sep:
+                    _err(f"Error: Invalid environment variable format: {env_var}\n")
                     sys.exit(1)
-                key, value = env_var.split("=", 1)
                 env_vars[key] = value
 
         # Add explicitly requested local environment variables
         if args.env_local:
             for key in args.env_local:
-                if key in os.environ:
-                    env_vars[key] = os.environ[key]
+                value = env.get(key)
+                if value is None:
+                    _err(f"Warning: Local environment variable '{key}' not found\n")
                 else:
-                    print(
-                        f"Warning: Local environment variable '{key}' not found",
-                        file=sys.stderr,
-                    )
+                    env_vars[key] = value
 
         # Create client and connect
         client = SSHSlurmClient(
@@ -303,7 +372,7 @@ def main():
             # Submit job with rich status
             with Status("[blue]Submitting job...", console=console):
                 job = client.submit_sbatch_file(
-                    script_path=str(script_path),
+                    script_path=script_path,
                     job_name=args.job_name,
                     cleanup=not args.no_cleanup,
                 )
@@ -333,14 +402,16 @@ def main():
                 console.print("[dim]🔌 Disconnected from server[/dim]")
 
     except Exception as e:
-        print(f"Error: {e}", file=sys.stderr)
+        _err(f"Error: {e}\n")
         sys.exit(1)
 
 
 def _monitor_job_with_rich(
-    client: SSHSlurmClient, job, poll_interval: int, timeout: int | None
+    client: "SSHSlurmClient", job, poll_interval: int, timeout: int | None
 ):
     """Monitor job with rich progress display"""
+    from ..core.client import TERMINAL_JOB_STATES
+
     start_time = time.time()
 
     # Status mapping for display
@@ -391,13 +462,7 @@ def _monitor_job_with_rich(
             )
 
             # Check if job is finished
-            if job.status in [
-                "COMPLETED",
-                "FAILED",
-                "CANCELLED",
-                "TIMEOUT",
-                "NOT_FOUND",
-            ]:
+            if job.status in TERMINAL_JOB_STATES:
                 break
 
             # Check timeout
@@ -424,11 +489,14 @@ def _monitor_job_with_rich(
     console.print(result_panel)
 
     # Show logs if job failed or had errors
-    if job.status in ["FAILED", "CANCELLED", "TIMEOUT"]:
+    if job.status in TERMINAL_JOB_STATES and job.status not in (
+        "COMPLETED",
+        "NOT_FOUND",
+    ):
         _show_job_logs(client, job)
 
 
-def _show_job_logs(client: SSHSlurmClient, job):
+def _show_job_logs(client: "SSHSlurmClient", job):
     """Show job logs with rich formatting when job fails"""
     console.print("\n[yellow]📋 Retrieving job logs...[/yellow]")
 
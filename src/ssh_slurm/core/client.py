@@ -1,14 +1,95 @@
 import logging
 import os
 import re
+import select
+import shlex
+import threading
 import time
 import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
+from types import MappingProxyType
+from typing import Any
 
 import paramiko
 
 from .proxy_client import ProxySSHClient, create_proxy_aware_connection
+from .transport import open_tuned_socket, open_tuned_transport
+
+# Local read size for SFTP uploads; paramiko splits each write into
+# protocol-sized requests which are pipelined without waiting for acks
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+# Job ID in sbatch's "Submitted batch job <id>" output
+SBATCH_JOB_ID_RE = re.compile(r"Submitted batch job (\d+)")
+
+# Bytes requested per recv() when collecting command output
+CHANNEL_READ_SIZE = 65536
+
+# Job states after which monitoring stops
+TERMINAL_JOB_STATES = (
+    "COMPLETED",
+    "FAILED",
+    "CANCELLED",
+    "TIMEOUT",
+    "OUT_OF_MEMORY",
+    "NODE_FAIL",
+    "PREEMPTED",
+    "BOOT_FAIL",
+    "DEADLINE",
+    "NOT_FOUND",
+)
+
+# Seconds a job status from squeue/sacct is reused before querying again; kept
+# below monitor_job's initial polling interval so backoff polls stay fresh
+STATUS_CACHE_TTL = 0.5
+
+# Terminal states that can no longer change, so their cache entries never
+# expire (NOT_FOUND may just mean accounting has not caught up yet)
+FINAL_JOB_STATES = frozenset(TERMINAL_JOB_STATES) - {"NOT_FOUND"}
+
+# Seconds a remote file existence check is reused
+FILE_EXISTS_CACHE_TTL = 30.0
+
+# Delimits directories and files in the batched log file search and read
+LOG_SEPARATOR = "__SSB_LOG_SEPARATOR__"
+
+# Locations checked for sbatch when it is not on the login shell PATH
+COMMON_SLURM_PATHS = (
+    "/cm/shared/apps/slurm/current/bin",
+    "/usr/bin",
+    "/usr/local/bin",
+    "/opt/slurm/bin",
+    "/cluster/slurm/bin",
+)
+
+
+def _drain_channel(channel: paramiko.Channel) -> tuple[bytes, bytes, int]:
+    """Read stdout and stderr of a command channel together until it exits
+
+    Interleaving the reads means a command that fills one stream is never
+    left waiting while the other is drained.
+    """
+    stdout_data = bytearray()
+    stderr_data = bytearray()
+    while True:
+        if channel.recv_ready():
+            stdout_data += channel.recv(CHANNEL_READ_SIZE)
+        elif channel.recv_stderr_ready():
+            stderr_data += channel.recv_stderr(CHANNEL_READ_SIZE)
+        elif channel.closed or (channel.eof_received and channel.exit_status_ready()):
+            break
+        else:
+            select.select([channel], [], [], 0.05)
+
+    return bytes(stdout_data), bytes(stderr_data), channel.recv_exit_status()
+
+
+def _normalize_job_state(state: str) -> str:
+    """Drop qualifiers from a SLURM state (CANCELLED by 1234 -> CANCELLED)"""
+    words = state.split()
+    return words[0].rstrip("+") if words else ""
 
 
 @dataclass
@@ -35,6 +116,7 @@ class SSHSlurmClient:
         ssh_config_path: str | None = None,
         env_vars: dict | None = None,
         verbose: bool = False,
+        compress: bool = True,
     ):
         self.hostname = hostname
         self.username = username
@@ -52,8 +134,20 @@ class SSHSlurmClient:
         self._slurm_env: dict[str, str] | None = (
             None  # Cache for SLURM environment variables
         )
-        self.custom_env_vars = env_vars or {}  # Custom environment variables to pass
+        self._slurm_shell: paramiko.Channel | None = None  # Persistent login shell
+        self._slurm_shell_marker = b""
+        # Commands share one shell, so callers on other threads take turns;
+        # reentrant so the shell can be opened or closed while it is held
+        self._slurm_shell_lock = threading.RLock()
+        # TTL caches: job_id -> (time, status) and remote path -> (time, exists)
+        self._status_cache: dict[str, tuple[float, str]] = {}
+        self._exists_cache: dict[str, tuple[float, bool]] = {}
+        # Custom environment variables to pass; read-only because the SLURM
+        # environment setup built from them is cached
+        self.custom_env_vars = MappingProxyType(dict(env_vars or {}))
+        self._slurm_env_setup: str | None = None
         self.verbose = verbose  # Control detailed logging
+        self.compress = compress  # zlib compression at the SSH transport layer
 
     def connect(self) -> bool:
         try:
@@ -70,6 +164,7 @@ class SSHSlurmClient:
                     proxy_jump=self.proxy_jump,
                     ssh_config_path=self.ssh_config_path,
                     logger=self.logger,
+                    compress=self.compress,
                 )
             else:
                 # Direct connection
@@ -82,6 +177,9 @@ class SSHSlurmClient:
                         username=self.username,
                         key_filename=self.key_filename,
                         port=self.port,
+                        sock=open_tuned_socket(self.hostname, self.port),
+                        transport_factory=open_tuned_transport,
+                        compress=self.compress,
                     )
                 else:
                     self.ssh_client.connect(
@@ -89,33 +187,48 @@ class SSHSlurmClient:
                         username=self.username,
                         password=self.password,
                         port=self.port,
+                        sock=open_tuned_socket(self.hostname, self.port),
+                        transport_factory=open_tuned_transport,
+                        compress=self.compress,
                     )
 
-            # Create SFTP client for file transfers
-            self.sftp_client = self.ssh_client.open_sftp()
-
-            # Create temp directory on server
-            self.execute_command(f"mkdir -p {self.temp_dir}")
-
-            # Initialize SLURM paths and environment
-            self._initialize_slurm_paths()
-            self._initialize_slurm_environment()
+            # Set up the session concurrently, each task on its own channel:
+            # the SFTP client for file transfers, the temp directory and SLURM
+            # detection (reused across reconnects of the same client), and the
+            # persistent SLURM shell
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                sftp_future = executor.submit(self.ssh_client.open_sftp)
+                setup_future: Future[Any]
+                if self._slurm_path and self._slurm_env is not None:
+                    setup_future = executor.submit(
+                        self.execute_command, f"mkdir -p {self.temp_dir}"
+                    )
+                else:
+                    setup_future = executor.submit(self._initialize_slurm)
+                shell_future = executor.submit(self._open_slurm_shell)
 
-            # Final verification of SLURM setup
-            self._verify_slurm_setup()
+            self.sftp_client = sftp_future.result()
+            setup_future.result()
+            if shell_future.exception():
+                # Opened again on the first SLURM command, or bypassed
+                self.logger.debug(
+                    "Could not start SLURM shell: %s", shell_future.exception()
+                )
+                self._close_slurm_shell()
 
             connection_info = f"{self.hostname}"
             if self.proxy_jump:
                 connection_info += f" (via {self.proxy_jump})"
             if self.verbose:
-                self.logger.info(f"Successfully connected to {connection_info}")
+                self.logger.info("Successfully connected to %s", connection_info)
             return True
 
         except Exception as e:
-            self.logger.error(f"Failed to connect to {self.hostname}: {e}")
+            self.logger.error("Failed to connect to %s: %s", self.hostname, e)
             return False
 
     def disconnect(self):
+        self._close_slurm_shell()
         if self.sftp_client:
             self.sftp_client.close()
             self.sftp_client = None
@@ -130,18 +243,40 @@ class SSHSlurmClient:
         if self.proxy_jump:
             connection_info += f" (via {self.proxy_jump})"
         if self.verbose:
-            self.logger.info(f"Disconnected from {connection_info}")
+            self.logger.info("Disconnected from %s", connection_info)
 
     def execute_command(self, command: str) -> tuple[str, str, int]:
+        stdout_data, stderr_data, exit_code = self.execute_command_bytes(command)
+
+        return stdout_data.decode("utf-8"), stderr_data.decode("utf-8"), exit_code
+
+    def execute_command_bytes(self, command: str) -> tuple[bytes, bytes, int]:
+        """Like execute_command, but return the raw output for machine checks"""
         if not self.ssh_client:
             raise ConnectionError("SSH client is not connected")
 
         stdin, stdout, stderr = self.ssh_client.exec_command(command)
-        stdout_data = stdout.read().decode("utf-8")
-        stderr_data = stderr.read().decode("utf-8")
-        exit_code = stdout.channel.recv_exit_status()
+        return _drain_channel(stdout.channel)
+
+    def execute_script(
+        self, script: str, shell: str = "bash -l"
+    ) -> tuple[str, str, int]:
+        """Run a multi-line script as a remote shell's -c argument
+
+        The script is not fed on stdin, which is closed instead, so commands
+        run while sourcing the login profile or by the script itself cannot
+        swallow the rest of the script by reading from it.
+        """
+        if not self.ssh_client:
+            raise ConnectionError("SSH client is not connected")
 
-        return stdout_data, stderr_data, exit_code
+        stdin, stdout, stderr = self.ssh_client.exec_command(
+            f"{shell} -c {shlex.quote(script)}"
+        )
+        stdin.channel.shutdown_write()
+        stdout_data, stderr_data, exit_code = _drain_channel(stdout.channel)
+
+        return stdout_data.decode("utf-8"), stderr_data.decode("utf-8"), exit_code
 
     def upload_file(self, local_path: str, remote_path: str | None = None) -> str:
         """Upload a local file to the server and return the remote path"""
@@ -154,202 +289,249 @@ class SSHSlurmClient:
 
         if remote_path is None:
             # Generate unique remote path in temp directory
-            unique_id = str(uuid.uuid4())[:8]
+            unique_id = uuid.uuid4().hex[:8]
             remote_filename = (
                 f"{local_path_obj.stem}_{unique_id}{local_path_obj.suffix}"
             )
             remote_path = f"{self.temp_dir}/{remote_filename}"
 
         try:
-            self.sftp_client.put(str(local_path_obj), remote_path)
-            # Make the uploaded script executable if it's a script
-            if local_path_obj.suffix in [".sh", ".py", ".pl", ".r"]:
-                self.execute_command(f"chmod +x {remote_path}")
+            with (
+                open(local_path_obj, "rb") as src,
+                self.sftp_client.open(remote_path, "wb") as dst,
+            ):
+                dst.set_pipelined(True)
+                while chunk := src.read(UPLOAD_CHUNK_SIZE):
+                    dst.write(chunk)
+                # Make the uploaded script executable if it's a script
+                if local_path_obj.suffix in [".sh", ".py", ".pl", ".r"]:
+                    dst.chmod(0o755)
+            self._exists_cache[remote_path] = (time.monotonic(), True)
             if self.verbose:
-                self.logger.info(f"Uploaded {local_path} to {remote_path}")
+                self.logger.info("Uploaded %s to %s", local_path, remote_path)
             return remote_path
         except Exception as e:
-            self.logger.error(f"Failed to upload file: {e}")
+            self.logger.error("Failed to upload file: %s", e)
             raise
 
     def cleanup_file(self, remote_path: str) -> None:
         """Remove a file from the server"""
+        self._exists_cache.pop(remote_path, None)
         try:
             self.execute_command(f"rm -f {remote_path}")
             if self.verbose:
-                self.logger.info(f"Cleaned up remote file: {remote_path}")
+                self.logger.info("Cleaned up remote file: %s", remote_path)
         except Exception as e:
-            self.logger.warning(f"Failed to cleanup file {remote_path}: {e}")
+            self.logger.warning("Failed to cleanup file %s: %s", remote_path, e)
 
     def file_exists(self, remote_path: str) -> bool:
-        """Check if a file exists on the server"""
-        stdout, stderr, exit_code = self.execute_command(
+        """Check if a file exists on the server (cached for FILE_EXISTS_CACHE_TTL)"""
+        cached = self._exists_cache.get(remote_path)
+        if cached and time.monotonic() - cached[0] < FILE_EXISTS_CACHE_TTL:
+            return cached[1]
+
+        stdout, _, _ = self.execute_command_bytes(
             f"test -f {remote_path} && echo 'exists' || echo 'not_found'"
         )
-        exists = stdout.strip() == "exists"
-        self.logger.debug(f"File existence check for {remote_path}: {exists}")
+        exists = stdout.strip() == b"exists"
+        self._exists_cache[remote_path] = (time.monotonic(), exists)
+        self.logger.debug("File existence check for %s: %s", remote_path, exists)
         return exists
 
+    def _read_remote_file(self, remote_path: str, default: str = "") -> str:
+        """Read a remote text file over SFTP, returning default if unreadable
+
+        prefetch() issues all read requests up front, so large logs arrive
+        at link speed instead of one request per round trip.
+        """
+        if not self.sftp_client:
+            raise ConnectionError("SFTP client is not connected")
+
+        try:
+            with self.sftp_client.open(remote_path, "rb") as remote_file:
+                remote_file.prefetch()
+                return remote_file.read().decode("utf-8", errors="replace")
+        except OSError as e:
+            self.logger.debug("Could not read remote file %s: %s", remote_path, e)
+            return default
+
     def validate_remote_script(self, remote_path: str) -> tuple[bool, str]:
         """Validate a remote script file and return (is_valid, error_message)"""
+        # Run every check in one command: existence, readability,
+        # executability and size as KEY=value lines, then for shell scripts
+        # the `bash -n` output followed by its exit status
+        checks = [
+            f"P={shlex.quote(remote_path)}",
+            '[ -f "$P" ] && echo F=1 || echo F=0',
+            '[ -r "$P" ] && echo R=1 || echo R=0',
+            '[ -x "$P" ] && echo X=1 || echo X=0',
+            'echo "SZ=$(wc -c < "$P" 2>/dev/null || echo 0)"',
+        ]
+        is_shell_script = remote_path.endswith(".sh")
+        if is_shell_script:
+            checks.append('[ -r "$P" ] && bash -n "$P" 2>&1; echo "SYN=$?"')
+        stdout, _, _ = self.execute_command_bytes("; ".join(checks))
+
+        # Match lines by key rather than position so that login banners or
+        # other shell output cannot shift them; lines between SZ and SYN are
+        # the syntax check output
+        results: dict[bytes, bytes] = {}
+        syntax_lines = []
+        for line in stdout.splitlines():
+            key, sep, value = line.partition(b"=")
+            if sep and key in (b"F", b"R", b"X", b"SZ", b"SYN"):
+                results[key] = value
+            elif b"SZ" in results and b"SYN" not in results:
+                syntax_lines.append(line)
+
         # Check if file exists
-        if not self.file_exists(remote_path):
+        exists = results.get(b"F") == b"1"
+        self._exists_cache[remote_path] = (time.monotonic(), exists)
+        self.logger.debug("File existence check for %s: %s", remote_path, exists)
+        if not exists:
             return False, f"Remote script file not found: {remote_path}"
 
         # Check if file is readable
-        stdout, stderr, exit_code = self.execute_command(
-            f"test -r {remote_path} && echo 'readable' || echo 'not_readable'"
-        )
-        if stdout.strip() != "readable":
+        if results.get(b"R") != b"1":
             return False, f"Remote script file is not readable: {remote_path}"
 
         # Check if file is executable (warn if not)
-        stdout, stderr, exit_code = self.execute_command(
-            f"test -x {remote_path} && echo 'executable' || echo 'not_executable'"
-        )
-        if stdout.strip() != "executable":
+        if results.get(b"X") != b"1":
             self.logger.warning(
-                f"Remote script file is not executable: {remote_path}. SLURM may fail to run it."
+                "Remote script file is not executable: %s. SLURM may fail to run it.",
+                remote_path,
             )
 
         # Check file size (warn if empty or too large)
-        stdout, stderr, exit_code = self.execute_command(
-            f"wc -c < {remote_path} 2>/dev/null || echo '0'"
-        )
         try:
-            file_size = int(stdout.strip())
+            file_size = int(results.get(b"SZ", b""))
             if file_size == 0:
-                self.logger.warning(f"Remote script file is empty: {remote_path}")
+                self.logger.warning("Remote script file is empty: %s", remote_path)
             elif file_size > 1024 * 1024:  # 1MB
                 self.logger.warning(
-                    f"Remote script file is very large ({file_size} bytes): {remote_path}"
+                    "Remote script file is very large (%s bytes): %s",
+                    file_size,
+                    remote_path,
                 )
 
-            self.logger.debug(f"Remote script file size: {file_size} bytes")
+            self.logger.debug("Remote script file size: %s bytes", file_size)
         except ValueError:
-            self.logger.warning(f"Could not determine file size for: {remote_path}")
+            self.logger.warning("Could not determine file size for: %s", remote_path)
 
         # Basic syntax check for shell scripts
-        if remote_path.endswith(".sh"):
-            stdout, stderr, exit_code = self.execute_command(
-                f"bash -n {remote_path} 2>&1 || echo 'SYNTAX_ERROR'"
-            )
-            if "SYNTAX_ERROR" in stdout or exit_code != 0:
+        if is_shell_script:
+            syntax_output = b"\n".join(syntax_lines).decode("utf-8", errors="replace")
+            if results.get(b"SYN") != b"0":
                 return (
                     False,
-                    f"Shell script syntax error in {remote_path}: {stdout.strip()}",
+                    f"Shell script syntax error in {remote_path}: {syntax_output.strip()}",
                 )
-            self.logger.debug(f"Shell script syntax check passed for {remote_path}")
+            self.logger.debug("Shell script syntax check passed for %s", remote_path)
 
         return True, "Script validation successful"
 
-    def _initialize_slurm_paths(self) -> None:
-        """Initialize SLURM command paths by checking common locations and environment"""
+    def _build_slurm_probe_script(self) -> str:
+        """Build the script run by _initialize_slurm
+
+        Every result is printed as a KEY=value line; captured environment
+        variables are prefixed with ENV: so they cannot clash with the keys.
+        """
+        common_paths = " ".join(COMMON_SLURM_PATHS)
+        return f"""\
+mkdir -p {self.temp_dir}
+echo "LOGIN_PATH=$PATH"
+__ssb_sbatch=$(which sbatch 2>/dev/null)
+echo "LOGIN_SBATCH=$__ssb_sbatch"
+__ssb_dir=${{__ssb_sbatch%/*}}
+if [ -z "$__ssb_sbatch" ]; then
+    for __ssb_path in {common_paths}; do
+        if [ -f "$__ssb_path/sbatch" ]; then
+            __ssb_dir=$__ssb_path
+            echo "SLURM_DIR=$__ssb_path"
+            [ -x "$__ssb_path/sbatch" ] && echo "SLURM_DIR_EXECUTABLE=1"
+            break
+        fi
+    done
+fi
+{self._get_slurm_env_setup()}
+echo "ENV_SBATCH=$(which sbatch 2>/dev/null)"
+env | grep -E '^(SLURM|CLUSTER|PATH)=' | head -20 | sed 's/^/ENV:/'
+echo "VERSION=$("${{__ssb_dir:+$__ssb_dir/}}sbatch" --version 2>/dev/null | head -1)"
+"""
+
+    def _initialize_slurm(self) -> None:
+        """Locate SLURM, capture its environment and verify it in one round trip"""
         try:
-            # Try with login shell environment
-            stdout, stderr, exit_code = self.execute_command(
-                "bash -l -c 'echo $PATH' 2>/dev/null || echo ''"
+            stdout, stderr, exit_code = self.execute_script(
+                self._build_slurm_probe_script()
+            )
+            self.logger.debug(
+                "SLURM probe result: exit_code=%s, stderr='%s'", exit_code, stderr
             )
 
-            if stdout.strip():
-                login_path = stdout.strip()
-                self.logger.debug(f"Login shell PATH: {login_path}")
+            lines = stdout.splitlines()
+            env_vars = dict(
+                line[4:].split("=", 1)
+                for line in lines
+                if line.startswith("ENV:") and "=" in line
+            )
+            probe = dict(
+                line.split("=", 1)
+                for line in lines
+                if "=" in line and not line.startswith("ENV:")
+            )
 
-                # Test if SLURM commands are available with login shell
-                stdout, stderr, exit_code = self.execute_command(
-                    "bash -l -c 'which sbatch' 2>/dev/null || echo 'NOT_FOUND'"
-                )
+            self.logger.debug("Login shell PATH: %s", probe.get("LOGIN_PATH", ""))
 
+            # SLURM command paths: login shell PATH first, then common locations
+            sbatch_path = probe.get("LOGIN_SBATCH")
+            if sbatch_path:
+                self._slurm_path = sbatch_path.rsplit("/", 1)[0]  # Get directory
+                if self.verbose:
+                    self.logger.info("Found SLURM at: %s", self._slurm_path)
+                    self.logger.debug("Full sbatch path: %s", sbatch_path)
+            elif probe.get("SLURM_DIR"):
+                self._slurm_path = probe["SLURM_DIR"]
+                if self.verbose:
+                    self.logger.info("Found SLURM at: %s", self._slurm_path)
                 self.logger.debug(
-                    f"SLURM which command result: stdout='{stdout}', stderr='{stderr}', exit_code={exit_code}"
-                )
-
-                if exit_code == 0 and "NOT_FOUND" not in stdout:
-                    sbatch_path = stdout.strip()
-                    self._slurm_path = sbatch_path.rsplit("/", 1)[0]  # Get directory
-                    if self.verbose:
-                        self.logger.info(f"Found SLURM at: {self._slurm_path}")
-                        self.logger.debug(f"Full sbatch path: {sbatch_path}")
-                    return
-
-            # Fallback: Check common SLURM installation paths
-            common_paths = [
-                "/cm/shared/apps/slurm/current/bin",
-                "/usr/bin",
-                "/usr/local/bin",
-                "/opt/slurm/bin",
-                "/cluster/slurm/bin",
-            ]
-
-            for path in common_paths:
-                stdout, stderr, exit_code = self.execute_command(
-                    f"test -f {path}/sbatch && echo 'FOUND' || echo 'NOT_FOUND'"
+                    "SLURM executable check: %s", "SLURM_DIR_EXECUTABLE" in probe
                 )
-                self.logger.debug(f"Checking {path}: {stdout.strip()}")
-                if "FOUND" in stdout:
-                    self._slurm_path = path
-                    if self.verbose:
-                        self.logger.info(f"Found SLURM at: {self._slurm_path}")
-                    # Verify permissions
-                    stdout, stderr, exit_code = self.execute_command(
-                        f"test -x {path}/sbatch && echo 'EXECUTABLE' || echo 'NOT_EXECUTABLE'"
-                    )
-                    self.logger.debug(f"SLURM executable check: {stdout.strip()}")
-                    return
-
-            self.logger.warning("SLURM commands not found in standard locations")
-
-        except Exception as e:
-            self.logger.warning(f"Failed to initialize SLURM paths: {e}")
-
-    def _initialize_slurm_environment(self) -> None:
-        """Capture the actual working SLURM environment"""
-        try:
-            # Test if sbatch works with full environment setup
-            env_setup = self._get_slurm_env_setup()
-            test_cmd = f"{env_setup} && which sbatch 2>/dev/null || echo 'NOT_FOUND'"
-
-            stdout, stderr, exit_code = self.execute_command(f"bash -l -c '{test_cmd}'")
-
-            self.logger.debug(
-                f"SLURM verification test: stdout='{stdout}', stderr='{stderr}', exit_code={exit_code}"
-            )
+            else:
+                self.logger.warning("SLURM commands not found in standard locations")
 
-            if exit_code == 0 and "NOT_FOUND" not in stdout and stdout.strip():
-                sbatch_location = stdout.strip()
+            # SLURM environment after the full login setup
+            sbatch_location = probe.get("ENV_SBATCH")
+            if sbatch_location:
                 if self.verbose:
-                    self.logger.info(f"SLURM sbatch verified at: {sbatch_location}")
-
-                # Try to get SLURM environment variables after setup
-                env_cmd = (
-                    f"{env_setup} && env | grep -E '^(SLURM|CLUSTER|PATH)' | head -20"
-                )
-                stdout, stderr, exit_code = self.execute_command(
-                    f"bash -l -c '{env_cmd}'"
-                )
-
-                if exit_code == 0 and stdout.strip():
-                    # Parse environment variables
-                    env_vars = {}
-                    for line in stdout.strip().split("\n"):
-                        if "=" in line:
-                            key, value = line.split("=", 1)
-                            env_vars[key] = value
+                    self.logger.info("SLURM sbatch verified at: %s", sbatch_location)
+                if env_vars:
                     self._slurm_env = env_vars
                     if self.verbose:
                         self.logger.info(
-                            f"Captured SLURM environment with {len(env_vars)} variables"
+                            "Captured SLURM environment with %s variables",
+                            len(env_vars),
                         )
                         self.logger.debug(
-                            f"Environment variables: {list(env_vars.keys())}"
+                            "Environment variables: %s", list(env_vars.keys())
                         )
             else:
                 self.logger.warning(
-                    f"SLURM sbatch test failed. stdout: {stdout}, stderr: {stderr}"
+                    "SLURM sbatch test failed. stdout: %s, stderr: %s", stdout, stderr
+                )
+
+            # Final verification of SLURM setup
+            version = probe.get("VERSION")
+            if version:
+                if self.verbose:
+                    self.logger.info("SLURM verification successful: %s", version)
+            else:
+                self.logger.warning(
+                    "SLURM verification failed: %s / %s", stdout, stderr
                 )
 
         except Exception as e:
-            self.logger.warning(f"Failed to initialize SLURM environment: {e}")
+            self.logger.warning("Failed to initialize SLURM: %s", e)
 
     def _get_slurm_command(self, command: str) -> str:
         """Get the full path for a SLURM command, or use login shell if path not found"""
@@ -361,9 +543,6 @@ class SSHSlurmClient:
 
     def _execute_slurm_command(self, command: str) -> tuple[str, str, int]:
         """Execute a SLURM command with proper environment"""
-        # Always use full login shell environment with proper SLURM command path
-        env_setup = self._get_slurm_env_setup()
-
         # Build the command with full path if available
         if self._slurm_path:
             # Replace SLURM commands with full paths
@@ -375,26 +554,132 @@ class SSHSlurmClient:
                         cmd, f"{self._slurm_path}/{cmd}", 1
                     )
                     break
-            final_command = f"{env_setup} && {modified_command}"
         else:
             # Use login shell to find commands in PATH
-            final_command = f"{env_setup} && {command}"
-
-        # Execute with bash login shell
-        full_cmd = f"bash -l -c '{final_command}'"
-        self.logger.debug(f"Executing SLURM command: {full_cmd}")
-        stdout, stderr, exit_code = self.execute_command(full_cmd)
-        self.logger.debug(
-            f"SLURM command result: exit_code={exit_code}, stdout_len={len(stdout)}, stderr_len={len(stderr)}"
-        )
-        if stderr and exit_code != 0:
+            modified_command = command
+
+        self.logger.debug("Executing SLURM command: %s", modified_command)
+        result = self._run_in_persistent_shell(modified_command)
+        if result is None:
+            # No persistent shell; run this command in a one-off login shell
+            env_setup = self._get_slurm_env_setup()
+            result = self.execute_command(
+                f"bash -l -c {shlex.quote(f'{env_setup} && {modified_command}')}"
+            )
+        stdout, stderr, exit_code = result
+        if self.logger.isEnabledFor(logging.DEBUG):
             self.logger.debug(
-                f"SLURM command stderr: {stderr[:500]}..."
-            )  # First 500 chars
+                "SLURM command result: exit_code=%s, stdout_len=%s, stderr_len=%s",
+                exit_code,
+                len(stdout),
+                len(stderr),
+            )
+            if stderr and exit_code != 0:
+                self.logger.debug(
+                    "SLURM command stderr: %s...", stderr[:500]
+                )  # First 500 chars
         return stdout, stderr, exit_code
 
+    def _run_in_persistent_shell(self, command: str) -> tuple[str, str, int] | None:
+        """Run a command in the persistent shell, opening it if needed
+
+        Returns None when the shell cannot be opened. Opening and running
+        happen under one lock acquisition so that another thread cannot
+        close the shell in between.
+        """
+        with self._slurm_shell_lock:
+            if not self._slurm_shell:
+                try:
+                    self._open_slurm_shell()
+                except (EOFError, OSError, paramiko.SSHException) as e:
+                    self.logger.debug(
+                        "SLURM shell unavailable (%s), using bash -l -c", e
+                    )
+                    self._close_slurm_shell()
+                    return None
+            try:
+                return self._run_in_slurm_shell(command)
+            except (EOFError, OSError, paramiko.SSHException):
+                # Not retried: the command may already have run (e.g. sbatch).
+                # The shell is reopened on the next call.
+                self._close_slurm_shell()
+                raise
+
+    def _open_slurm_shell(self) -> paramiko.Channel:
+        """Start the long-lived login shell used for SLURM commands
+
+        The SLURM environment setup runs once here instead of once per
+        command; its output is drained so it does not leak into the first
+        command's result.
+        """
+        if not self.ssh_client:
+            raise ConnectionError("SSH client is not connected")
+
+        with self._slurm_shell_lock:
+            channel = self.ssh_client.get_transport().open_session()
+            channel.exec_command("bash -l -s")
+            self._slurm_shell = channel
+            self._slurm_shell_marker = f"__SSB_DONE_{uuid.uuid4().hex}_".encode()
+            self._run_in_slurm_shell(self._get_slurm_env_setup())
+            return channel
+
+    def _close_slurm_shell(self) -> None:
+        with self._slurm_shell_lock:
+            if self._slurm_shell:
+                self._slurm_shell.close()
+                self._slurm_shell = None
+
+    def _run_in_slurm_shell(self, command: str) -> tuple[str, str, int]:
+        """Run a command in the persistent shell and wait for its end marker"""
+        channel = self._slurm_shell
+        if channel is None:
+            raise EOFError("SLURM shell is not open")
+        marker = self._slurm_shell_marker.decode()
+
+        # The command goes through eval as one quoted word, so a syntax error
+        # (e.g. an unbalanced quote) ends that command only and the markers
+        # still run. Commands must not read the shell's stdin, which carries
+        # the script.
+        script = (
+            f"{{\neval {shlex.quote(command)}\n}} </dev/null\n"
+            f'echo "{marker}$?"\necho "{marker}" >&2\n'
+        )
+        channel.sendall(script.encode())
+        stdout_data, exit_status = self._read_until_marker(channel.recv)
+        stderr_data, _ = self._read_until_marker(channel.recv_stderr)
+
+        return (
+            stdout_data.decode("utf-8"),
+            stderr_data.decode("utf-8"),
+            int(exit_status or 0),
+        )
+
+    def _read_until_marker(self, recv) -> tuple[bytes, bytes]:
+        """Read a shell stream up to the end marker line
+
+        Returns the data before the marker and the rest of the marker line
+        (the exit status on stdout).
+        """
+        marker = self._slurm_shell_marker
+        buffer = bytearray()
+        while True:
+            index = buffer.find(marker)
+            if index != -1:
+                end = buffer.find(b"\n", index)
+                if end != -1:
+                    return bytes(buffer[:index]), bytes(
+                        buffer[index + len(marker) : end]
+                    )
+            chunk = recv(32768)
+            if not chunk:
+                raise EOFError("SLURM shell closed unexpectedly")
+            buffer += chunk
+
     def _get_slurm_env_setup(self) -> str:
         """Get environment setup commands for SLURM execution"""
+        if self._slurm_env_setup is not None:
+            return self._slurm_env_setup
+
         # Use the exact same environment setup as an interactive login shell
         env_commands = [
             "cd ~",
@@ -417,32 +702,17 @@ class SSHSlurmClient:
             # Properly escape the value
             escaped_value = value.replace('"', '\\"').replace("$", "\\$")
             env_commands.append(f'export {key}="{escaped_value}"')
-            self.logger.debug(f"Adding custom environment variable: {key}={value}")
-
-        return " && ".join(env_commands)
-
-    def _verify_slurm_setup(self) -> None:
-        """Verify that SLURM commands are working properly"""
-        try:
-            test_cmd = (
-                "sbatch --version 2>/dev/null | head -1 || echo 'SLURM_NOT_AVAILABLE'"
-            )
-            stdout, stderr, exit_code = self._execute_slurm_command(test_cmd)
+            self.logger.debug("Adding custom environment variable: %s=%s", key, value)
 
-            if exit_code == 0 and "SLURM_NOT_AVAILABLE" not in stdout:
-                if self.verbose:
-                    self.logger.info(f"SLURM verification successful: {stdout.strip()}")
-            else:
-                self.logger.warning(f"SLURM verification failed: {stdout} / {stderr}")
-        except Exception as e:
-            self.logger.warning(f"SLURM verification error: {e}")
+        self._slurm_env_setup = " && ".join(env_commands)
+        return self._slurm_env_setup
 
     def _handle_slurm_error(
         self, command: str, error_output: str, exit_code: int
     ) -> None:
         """Handle SLURM command errors with helpful suggestions"""
         self.logger.error(
-            f"{command} failed with exit code {exit_code}: {error_output}"
+            "%s failed with exit code %s: %s", command, exit_code, error_output
         )
 
         # Common error patterns and suggestions
@@ -457,7 +727,7 @@ class SSHSlurmClient:
             )
             if self._slurm_path:
                 self.logger.error(
-                    f"4. Detected SLURM path: {self._slurm_path} - verify permissions"
+                    "4. Detected SLURM path: %s - verify permissions", self._slurm_path
                 )
         elif "permission denied" in error_lower:
             self.logger.error("Permission denied. Suggestions:")
@@ -486,36 +756,57 @@ class SSHSlurmClient:
         return self.execute_command(f'bash -l -c "{command}"')
 
     def submit_sbatch_job(
-        self, sbatch_script: str, job_name: str | None = None
+        self, sbatch_script: str, job_name: str | None = None, cleanup: bool = True
     ) -> SlurmJob | None:
+        """Submit a sbatch job from script contents held in memory"""
+        if not self.sftp_client:
+            raise ConnectionError("SFTP client is not connected")
+
+        # Write the script through SFTP instead of a shell heredoc, so its
+        # contents never need quoting
+        remote_script_path = f"{self.temp_dir}/sbatch_{uuid.uuid4().hex[:8]}.sh"
         try:
+            with self.sftp_client.open(remote_script_path, "wb") as remote_file:
+                remote_file.set_pipelined(True)
+                remote_file.write(sbatch_script.encode("utf-8"))
+                remote_file.chmod(0o755)
+
             command = "sbatch"
             if job_name:
-                command += f" --job-name={job_name}"
-            command += f" <<'EOF'\n{sbatch_script}\nEOF"
+                command += f" --job-name={shlex.quote(job_name)}"
+            command += f" {shlex.quote(remote_script_path)}"
 
             stdout, stderr, exit_code = self._execute_slurm_command(command)
 
             if exit_code != 0:
                 self._handle_slurm_error("sbatch", stderr, exit_code)
+                self.cleanup_file(remote_script_path)
                 return None
 
-            job_id_match = re.search(r"Submitted batch job (\d+)", stdout)
+            job_id_match = SBATCH_JOB_ID_RE.search(stdout)
             if job_id_match:
                 job_id = job_id_match.group(1)
                 if self.verbose:
-                    self.logger.info(f"Job submitted successfully with ID: {job_id}")
-                return SlurmJob(job_id=job_id, name=job_name or f"job_{job_id}")
+                    self.logger.info("Job submitted successfully with ID: %s", job_id)
+                job = SlurmJob(
+                    job_id=job_id,
+                    name=job_name or f"job_{job_id}",
+                    script_path=remote_script_path,
+                )
+                job._cleanup = cleanup
+                return job
             else:
-                self.logger.error(f"Could not parse job ID from output: {stdout}")
+                self.logger.error("Could not parse job ID from output: %s", stdout)
+                self.cleanup_file(remote_script_path)
                 return None
 
         except Exception as e:
-            self.logger.error(f"Failed to submit job: {e}")
+            self.logger.error("Failed to submit job: %s", e)
             self.logger.error("Debug suggestions:")
             self.logger.error("1. Verify SSH connection is stable")
             self.logger.error("2. Check if SLURM services are running")
             self.logger.error("3. Test with a simple script first")
+            self.cleanup_file(remote_script_path)
             return None
 
     def submit_sbatch_file(
@@ -539,7 +830,7 @@ class SSHSlurmClient:
                     )
                 remote_script_path = self.upload_file(script_path_str)
                 if self.verbose:
-                    self.logger.info(f"Uploaded local script to {remote_script_path}")
+                    self.logger.info("Uploaded local script to %s", remote_script_path)
             else:
                 # Use remote file directly - validate it first
                 remote_script_path = script_path_str
@@ -549,14 +840,16 @@ class SSHSlurmClient:
                 if not is_valid:
                     raise FileNotFoundError(validation_message)
                 if self.verbose:
-                    self.logger.info(f"Using remote script: {remote_script_path}")
-                    self.logger.debug(f"Remote script validation: {validation_message}")
+                    self.logger.info("Using remote script: %s", remote_script_path)
+                    self.logger.debug(
+                        "Remote script validation: %s", validation_message
+                    )
 
             # Submit the job using the script file
             command = "sbatch"
             if job_name:
-                command += f" --job-name={job_name}"
-            command += f" {remote_script_path}"
+                command += f" --job-name={shlex.quote(job_name)}"
+            command += f" {shlex.quote(remote_script_path)}"
 
             stdout, stderr, exit_code = self._execute_slurm_command(command)
 
@@ -566,11 +859,11 @@ class SSHSlurmClient:
                     self.cleanup_file(remote_script_path)
                 return None
 
-            job_id_match = re.search(r"Submitted batch job (\d+)", stdout)
+            job_id_match = SBATCH_JOB_ID_RE.search(stdout)
             if job_id_match:
                 job_id = job_id_match.group(1)
                 if self.verbose:
-                    self.logger.info(f"Job submitted successfully with ID: {job_id}")
+                    self.logger.info("Job submitted successfully with ID: %s", job_id)
 
                 job = SlurmJob(
                     job_id=job_id,
@@ -584,13 +877,13 @@ class SSHSlurmClient:
 
                 return job
             else:
-                self.logger.error(f"Could not parse job ID from output: {stdout}")
+                self.logger.error("Could not parse job ID from output: %s", stdout)
                 if is_local_file and cleanup and remote_script_path:
                     self.cleanup_file(remote_script_path)
                 return None
 
         except Exception as e:
-            self.logger.error(f"Failed to submit job from file {script_path}: {e}")
+            self.logger.error("Failed to submit job from file %s: %s", script_path, e)
             self.logger.error("Debug suggestions:")
             self.logger.error(
                 "1. Verify script file exists and has correct permissions"
@@ -607,25 +900,108 @@ class SSHSlurmClient:
             self.cleanup_file(job.script_path)
 
     def get_job_status(self, job_id: str) -> str:
+        return self.get_job_statuses([job_id])[job_id]
+
+    def get_job_statuses(self, job_ids: list[str]) -> dict[str, str]:
+        """Get the status of several jobs with one squeue and at most one sacct
+
+        Results are cached for STATUS_CACHE_TTL seconds so that repeated
+        polls in a tight loop do not each cost a round trip; final states
+        are cached for the lifetime of the client.
+        """
+        now = time.monotonic()
+        statuses = {}
+        pending = []
+        for job_id in job_ids:
+            cached = self._status_cache.get(job_id)
+            if cached and (
+                cached[1] in FINAL_JOB_STATES or now - cached[0] < STATUS_CACHE_TTL
+            ):
+                statuses[job_id] = cached[1]
+            else:
+                pending.append(job_id)
+        if not pending:
+            return statuses
+
         try:
+            fetched = {}
+            job_list = ",".join(pending)
+
+            # Queued and running jobs
             stdout, stderr, exit_code = self._execute_slurm_command(
-                f"squeue -j {job_id} -h -o %T"
+                f"squeue -j {job_list} -h -o '%i %T'"
             )
-
-            if exit_code == 0 and stdout.strip():
-                return stdout.strip()
-            else:
+            for line in stdout.splitlines():
+                job_id, _, state = line.strip().partition(" ")
+                state = _normalize_job_state(state)
+                if job_id in pending and state:
+                    fetched[job_id] = state
+
+            # Finished jobs from accounting; the first row per job is the
+            # allocation itself, followed by its steps
+            finished = [job_id for job_id in pending if job_id not in fetched]
+            if finished:
                 stdout, stderr, exit_code = self._execute_slurm_command(
-                    f"sacct -j {job_id} -n -o State"
+                    f"sacct -j {','.join(finished)} -n -P -o JobID,State"
                 )
-                if exit_code == 0 and stdout.strip():
-                    return stdout.strip().split("\n")[0].strip()
-
-            return "NOT_FOUND"
+                if exit_code == 0:
+                    for line in stdout.splitlines():
+                        job_id, _, state = line.strip().partition("|")
+                        state = _normalize_job_state(state)
+                        if job_id in finished and job_id not in fetched and state:
+                            fetched[job_id] = state
+
+            for job_id in pending:
+                status = fetched.get(job_id, "NOT_FOUND")
+                self._status_cache[job_id] = (now, status)
+                statuses[job_id] = status
 
         except Exception as e:
-            self.logger.error(f"Failed to get job status for job {job_id}: {e}")
-            return "ERROR"
+            self.logger.error("Failed to get job status for jobs %s: %s", pending, e)
+            for job_id in pending:
+                statuses[job_id] = "ERROR"
+
+        return statuses
+
+    def _build_log_search_script(self, patterns: list[str], log_dirs: list[str]) -> str:
+        """Build the sh script run by get_job_output
+
+        Runs one find per directory, then takes up to 5 matches per pattern
+        in directory/pattern order, printing a "<separator> R|U|S <path>"
+        header for each. Only the files get_job_output uses are read (R): the
+        first match and those whose path contains "err". U marks unreadable
+        files and S skipped ones.
+        """
+        name_filter = " -o ".join(
+            f"-name {shlex.quote(pattern)}" for pattern in patterns
+        )
+        quoted_patterns = " ".join(shlex.quote(pattern) for pattern in patterns)
+        return f"""\
+set -f
+IFS='
+'
+first=1
+for d in {" ".join(log_dirs)}; do
+    list=$(find "$d" \\( {name_filter} \\) -type f 2>/dev/null)
+    for p in {quoted_patterns}; do
+        n=0
+        for f in $list; do
+            case "${{f##*/}}" in $p) ;; *) continue ;; esac
+            [ "$n" -lt 5 ] || break
+            n=$((n + 1))
+            if [ ! -r "$f" ]; then
+                printf '\\n%s U %s\\n' {LOG_SEPARATOR} "$f"
+            elif [ "$first" = 1 ] || case "$f" in *[Ee][Rr][Rr]*) true ;; *) false ;; esac; then
+                printf '\\n%s R %s\\n' {LOG_SEPARATOR} "$f"
+                cat "$f"
+            else
+                printf '\\n%s S %s\\n' {LOG_SEPARATOR} "$f"
+            fi
+            first=0
+        done
+    done
+done
+"""
 
     def get_job_output(
         self, job_id: str, job_name: str | None = None
@@ -662,65 +1038,57 @@ class SSHSlurmClient:
             error_content = ""
             found_files = []
 
-            for log_dir in log_dirs:
-                for pattern in patterns:
-                    # Try to find log files with this pattern
-                    find_cmd = f"find {log_dir} -name '{pattern}' -type f 2>/dev/null | head -5"
-                    stdout, stderr, exit_code = self.execute_command(find_cmd)
+            # Search and read only the files used below in one round trip
+            search_script = self._build_log_search_script(patterns, log_dirs)
+            stdout, _, _ = self.execute_command_bytes(
+                f"sh -c {shlex.quote(search_script)}"
+            )
 
-                    if exit_code == 0 and stdout.strip():
-                        log_files = stdout.strip().split("\n")
-                        for log_file in log_files:
-                            if log_file.strip():
-                                found_files.append(log_file.strip())
-                                self.logger.debug(
-                                    f"Found potential log file: {log_file.strip()}"
-                                )
+            # Log contents may not be valid UTF-8; decode each file on its own
+            contents: dict[str, str | None] = {}
+            for entry in stdout.split(f"\n{LOG_SEPARATOR} ".encode())[1:]:
+                header, _, content = entry.partition(b"\n")
+                state, _, log_file = header.decode("utf-8", errors="replace").partition(
+                    " "
+                )
+                found_files.append(log_file)
+                self.logger.debug("Found potential log file: %s", log_file)
+                if state == "R":
+                    contents[log_file] = content.decode("utf-8", errors="replace")
 
             # Read content from found log files
             if found_files:
                 # Use the first found file as primary output
                 primary_log = found_files[0]
-                stdout_output, _, _ = self.execute_command(
-                    f"cat '{primary_log}' 2>/dev/null || echo 'Could not read log file'"
-                )
-                output_content = stdout_output
+                primary_content = contents.get(primary_log)
+                if primary_content is None:
+                    primary_content = "Could not read log file\n"
+                output_content = primary_content
 
                 # If there are separate error files or multiple files, try to distinguish
-                if len(found_files) > 1:
-                    for log_file in found_files[1:]:
-                        if "err" in log_file.lower() or "error" in log_file.lower():
-                            stderr_output, _, _ = self.execute_command(
-                                f"cat '{log_file}' 2>/dev/null || echo ''"
-                            )
-                            error_content += stderr_output
+                for log_file in found_files[1:]:
+                    if "err" in log_file.lower():
+                        error_content += contents.get(log_file) or ""
 
                 if self.verbose:
                     self.logger.info(
-                        f"Found {len(found_files)} log file(s) for job {job_id}"
+                        "Found %s log file(s) for job %s", len(found_files), job_id
                     )
-                    self.logger.debug(f"Primary log file: {primary_log}")
+                    self.logger.debug("Primary log file: %s", primary_log)
             else:
                 # Fallback to default SLURM patterns in current directory
                 self.logger.warning(
-                    f"No log files found for job {job_id} using common patterns"
+                    "No log files found for job %s using common patterns", job_id
                 )
 
-                # Try default patterns as fallback
-                default_patterns = [f"slurm-{job_id}.out", f"slurm-{job_id}.err"]
-                for pattern in default_patterns:
-                    stdout_output, _, _ = self.execute_command(
-                        f"cat {pattern} 2>/dev/null || echo ''"
-                    )
-                    if "out" in pattern:
-                        output_content += stdout_output
-                    else:
-                        error_content += stdout_output
+                # Try default patterns as fallback (relative to the login directory)
+                output_content = self._read_remote_file(f"slurm-{job_id}.out")
+                error_content = self._read_remote_file(f"slurm-{job_id}.err")
 
             return output_content, error_content
 
         except Exception as e:
-            self.logger.error(f"Failed to get job output for {job_id}: {e}")
+            self.logger.error("Failed to get job output for %s: %s", job_id, e)
             return "", ""
 
     def get_job_output_detailed(
@@ -752,12 +1120,15 @@ class SSHSlurmClient:
             stdout, stderr, exit_code = self.execute_command(f"bash -l -c '{cmd}'")
             if self.verbose:
                 self.logger.debug(
-                    f"SLURM_LOG_DIR command result: stdout='{stdout}', stderr='{stderr}', exit_code={exit_code}"
+                    "SLURM_LOG_DIR command result: stdout='%s', stderr='%s', exit_code=%s",
+                    stdout,
+                    stderr,
+                    exit_code,
                 )
             if exit_code == 0 and stdout.strip():
                 slurm_log_dir = stdout.strip()
                 if self.verbose:
-                    self.logger.info(f"Found SLURM_LOG_DIR: {slurm_log_dir}")
+                    self.logger.info("Found SLURM_LOG_DIR: %s", slurm_log_dir)
             else:
                 if self.verbose:
                     self.logger.info("SLURM_LOG_DIR not set on remote server")
@@ -811,17 +1182,14 @@ class SSHSlurmClient:
 
                 # Use the first (newest) found file as primary output
                 primary_log = found_files[0]
-                stdout_output, _, _ = self.execute_command(
-                    f"cat '{primary_log}' 2>/dev/null || echo 'Could not read log file'"
+                output_content = self._read_remote_file(
+                    primary_log, default="Could not read log file\n"
                 )
-                output_content = stdout_output
 
                 # Collect all error content from all files
                 for log_file in found_files:
                     if "err" in log_file.lower() or "error" in log_file.lower():
-                        stderr_output, _, _ = self.execute_command(
-                            f"cat '{log_file}' 2>/dev/null || echo ''"
-                        )
+                        stderr_output = self._read_remote_file(log_file)
                         if stderr_output.strip():
                             error_content += f"=== {log_file} ===\n{stderr_output}\n\n"
 
@@ -835,7 +1203,7 @@ class SSHSlurmClient:
             }
 
         except Exception as e:
-            self.logger.error(f"Failed to get detailed job output for {job_id}: {e}")
+            self.logger.error("Failed to get detailed job output for %s: %s", job_id, e)
             return {
                 "output": "",
                 "error": f"Error retrieving logs: {e}",
@@ -846,35 +1214,139 @@ class SSHSlurmClient:
             }
 
     def monitor_job(
-        self, job: SlurmJob, poll_interval: int = 10, timeout: int | None = None
+        self,
+        job: SlurmJob,
+        poll_interval: int = 10,
+        timeout: int | None = None,
+        initial_interval: float = 1.0,
+        backoff: float = 2.0,
     ) -> SlurmJob:
+        """Poll a job until it finishes (see monitor_jobs)"""
+        return self.monitor_jobs(
+            [job], poll_interval, timeout, initial_interval, backoff
+        )[0]
+
+    def monitor_jobs(
+        self,
+        jobs: list[SlurmJob],
+        poll_interval: int = 10,
+        timeout: int | None = None,
+        initial_interval: float = 1.0,
+        backoff: float = 2.0,
+    ) -> list[SlurmJob]:
+        """Poll jobs until all finish, blocking the calling thread
+
+        Same polling schedule as monitor_jobs_async, but without an event
+        loop, so it also works where one is already running (e.g. Jupyter).
+        """
         start_time = time.time()
+        interval = min(initial_interval, poll_interval)
+        pending = list(jobs)
 
-        while True:
-            job.status = self.get_job_status(job.job_id)
-
-            if job.status in [
-                "COMPLETED",
-                "FAILED",
-                "CANCELLED",
-                "TIMEOUT",
-                "NOT_FOUND",
-            ]:
-                if self.verbose:
-                    self.logger.info(
-                        f"Job {job.job_id} finished with status: {job.status}"
-                    )
+        while pending:
+            statuses = self.get_job_statuses([job.job_id for job in pending])
+            pending, changed = self._update_monitored_jobs(
+                pending, statuses, start_time, timeout
+            )
+            if not pending:
                 break
 
-            if timeout and (time.time() - start_time) > timeout:
-                self.logger.warning(f"Job {job.job_id} monitoring timed out")
+            if changed:
+                interval = min(initial_interval, poll_interval)
+            time.sleep(interval)
+            interval = min(interval * backoff, poll_interval)
+
+        return jobs
+
+    async def monitor_job_async(
+        self,
+        job: SlurmJob,
+        poll_interval: int = 10,
+        timeout: int | None = None,
+        initial_interval: float = 1.0,
+        backoff: float = 2.0,
+    ) -> SlurmJob:
+        """Poll a job until it finishes (see monitor_jobs_async)"""
+        jobs = await self.monitor_jobs_async(
+            [job], poll_interval, timeout, initial_interval, backoff
+        )
+        return jobs[0]
+
+    async def monitor_jobs_async(
+        self,
+        jobs: list[SlurmJob],
+        poll_interval: int = 10,
+        timeout: int | None = None,
+        initial_interval: float = 1.0,
+        backoff: float = 2.0,
+    ) -> list[SlurmJob]:
+        """Poll jobs until all of them finish
+
+        Each poll queries every unfinished job with one get_job_statuses
+        call. Polling starts every initial_interval seconds and backs off by
+        a factor of backoff up to poll_interval, restarting from
+        initial_interval whenever any status changes. Status queries run in
+        the default executor, so the event loop stays free for other work.
+        """
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        start_time = time.time()
+        interval = min(initial_interval, poll_interval)
+        pending = list(jobs)
+
+        while pending:
+            statuses = await loop.run_in_executor(
+                None, self.get_job_statuses, [job.job_id for job in pending]
+            )
+            pending, changed = self._update_monitored_jobs(
+                pending, statuses, start_time, timeout
+            )
+            if not pending:
                 break
 
-            if self.verbose:
-                self.logger.info(f"Job {job.job_id} status: {job.status}")
-            time.sleep(poll_interval)
+            if changed:
+                interval = min(initial_interval, poll_interval)
+            await asyncio.sleep(interval)
+            interval = min(interval * backoff, poll_interval)
+
+        return jobs
+
+    def _update_monitored_jobs(
+        self,
+        pending: list[SlurmJob],
+        statuses: dict[str, str],
+        start_time: float,
+        timeout: int | None,
+    ) -> tuple[list[SlurmJob], bool]:
+        """Apply one poll's statuses; return (jobs still to poll, any change)
+
+        Returns no pending jobs once timeout has elapsed since start_time.
+        """
+        changed = False
+        still_pending = []
+        for job in pending:
+            status = statuses[job.job_id]
+            if status != job.status:
+                changed = True
+            job.status = status
+
+            if status in TERMINAL_JOB_STATES:
+                if self.verbose:
+                    self.logger.info(
+                        "Job %s finished with status: %s", job.job_id, status
+                    )
+            else:
+                still_pending.append(job)
+                if self.verbose:
+                    self.logger.info("Job %s status: %s", job.job_id, status)
+
+        if still_pending and timeout and (time.time() - start_time) > timeout:
+            for job in still_pending:
+                self.logger.warning("Job %s monitoring timed out", job.job_id)
+            return [], changed
 
-        return job
+        return still_pending, changed
 
     def __enter__(self):
         if self.connect():
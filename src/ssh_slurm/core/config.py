@@ -1,11 +1,34 @@
+import errno
 import json
 import os
-from dataclasses import asdict, dataclass
+import pickle
+import stat
+import tempfile
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Self
 
+from .ssh_config import expand_user
 
-@dataclass
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _loads_json(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps_json(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
+
+@dataclass(frozen=True, slots=True)
 class ServerProfile:
     hostname: str
     username: str
@@ -16,80 +39,258 @@ class ServerProfile:
     env_vars: dict[str, str] | None = None  # Environment variables for this profile
 
     def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
+        # Written out instead of dataclasses.asdict, which deep-copies each field
+        return {
+            "hostname": self.hostname,
+            "username": self.username,
+            "key_filename": self.key_filename,
+            "port": self.port,
+            "description": self.description,
+            "ssh_host": self.ssh_host,
+            "env_vars": dict(self.env_vars) if self.env_vars is not None else None,
+        }
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> Self:
+        env_vars = data.get("env_vars")
+        if env_vars is not None:
+            # Don't share the mutable dict with the config data
+            data = {**data, "env_vars": dict(env_vars)}
         return cls(**data)
 
 
 class ConfigManager:
-    def __init__(self, config_path: str | None = None):
+    def __init__(self, config_path: str | None = None, use_cache: bool = False):
         self.config_path = (
             Path(config_path) if config_path else self._get_default_config_path()
         )
+        self.cache_path = self._get_default_cache_path()
+        self.use_cache = use_cache  # Read profiles through the pickle cache
         self.config_data: dict[str, Any] = {}
+        self._profiles: dict[str, dict[str, Any]] = {}  # config_data["profiles"]
+        self._dirty = False  # In-memory changes not yet written to config_path
+        self._batch_depth = 0  # Nesting level of `with` blocks deferring saves
+        self._loaded_mtime_ns: int | None = None  # mtime of the data in memory
+        self._saved_bytes: bytes | None = None  # File contents at that mtime
+        # ServerProfile instances built from config_data["profiles"], by name
+        self._profile_cache: dict[str, ServerProfile] = {}
         self.load_config()
 
+    def __enter__(self) -> Self:
+        """Defer saves until the outermost `with` block exits"""
+        self._batch_depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self._batch_depth -= 1
+        if self._batch_depth == 0 and exc_type is None:
+            self.flush()
+
     def _get_default_config_path(self) -> Path:
-        config_dir = Path.home() / ".config"
-        config_dir.mkdir(exist_ok=True)
-        return config_dir / "ssh-slurm.json"
+        return Path.home() / ".config" / "ssh-slurm.json"
+
+    def _get_default_cache_path(self) -> Path:
+        return Path.home() / ".cache" / "ssh-slurm" / "profiles.pkl"
+
+    def _cache_key(self) -> tuple[str, int]:
+        return str(self.config_path.resolve()), self.config_path.stat().st_mtime_ns
+
+    def _load_cached_config(self) -> dict[str, Any] | None:
+        """Return the cached config data if it matches the config file's mtime"""
+        try:
+            with open(self.cache_path, "rb") as f:
+                key, data = pickle.load(f)
+            if key == self._cache_key() and isinstance(data, dict):
+                return data
+        except (OSError, pickle.PickleError, EOFError, ValueError, TypeError):
+            pass
+        return None
+
+    def _write_cached_config(self) -> None:
+        """Write the cache atomically, readable only by the user
+
+        The cached data includes profile env_vars, which may hold secrets.
+        """
+        tmp_path = None
+        try:
+            self.cache_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            # mkstemp creates the file with mode 0600
+            fd, tmp_path = tempfile.mkstemp(
+                dir=self.cache_path.parent,
+                prefix=f".{self.cache_path.name}.",
+                suffix=".tmp",
+            )
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(
+                    (self._cache_key(), self.config_data),
+                    f,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+            os.replace(tmp_path, self.cache_path)
+        except OSError:
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+
+    def _invalidate_cache(self) -> None:
+        try:
+            os.unlink(self.cache_path)
+        except OSError:
+            pass
 
     def load_config(self) -> None:
-        if self.config_path.exists():
+        """Load the config file, skipping the read if it has not changed since
+        the last load or save
+
+        Unsaved changes (inside a `with` block) are kept: the file is not
+        reloaded over them, and the next save overwrites it.
+        """
+        if self._dirty:
+            return
+
+        try:
+            mtime_ns = self.config_path.stat().st_mtime_ns
+        except OSError:
+            mtime_ns = None
+
+        if mtime_ns is not None:
+            if mtime_ns == self._loaded_mtime_ns:
+                return
+
+            if self.use_cache:
+                cached = self._load_cached_config()
+                if cached is not None:
+                    self._set_config_data(cached)
+                    self._loaded_mtime_ns = mtime_ns
+                    self._saved_bytes = None
+                    return
+
             try:
-                with open(self.config_path, "r") as f:
-                    self.config_data = json.load(f)
+                raw = self.config_path.read_bytes()
+                self._set_config_data(_loads_json(raw))
             except (json.JSONDecodeError, IOError) as e:
                 raise RuntimeError(
                     f"Failed to load config from {self.config_path}: {e}"
                 )
+            self._loaded_mtime_ns = mtime_ns
+            self._saved_bytes = raw
+
+            if self.use_cache:
+                self._write_cached_config()
         else:
-            self.config_data = {"current_profile": None, "profiles": {}}
-            self.save_config()
+            # Nothing is written until the first change
+            self._set_config_data({"current_profile": None, "profiles": {}})
+
+    def _set_config_data(self, data: dict[str, Any]) -> None:
+        self.config_data = data
+        self._profiles = data.setdefault("profiles", {})
+        self._profile_cache.clear()
 
     def save_config(self) -> None:
+        """Atomically replace the config file via a temp file in the same dir
+
+        The write is skipped when the serialized data is identical to what
+        the file held at the last load or save and the file is unchanged since.
+        """
+        data = _dumps_json(self.config_data)
+        # Write through symlinks (e.g. a config kept in a dotfiles repo)
+        target = Path(os.path.realpath(self.config_path))
+        tmp_path = None
         try:
-            with open(self.config_path, "w") as f:
-                json.dump(self.config_data, f, indent=2)
-        except IOError as e:
+            try:
+                st = target.stat()
+            except FileNotFoundError:
+                mode = None
+                target.parent.mkdir(parents=True, exist_ok=True)
+            else:
+                if (
+                    data == self._saved_bytes
+                    and st.st_mtime_ns == self._loaded_mtime_ns
+                ):
+                    self._dirty = False
+                    return
+
+                mode = stat.S_IMODE(st.st_mode)
+                # Replacing the file would otherwise bypass its permissions
+                if not os.access(target, os.W_OK):
+                    raise PermissionError(
+                        errno.EACCES, "Permission denied", str(target)
+                    )
+
+            fd, tmp_path = tempfile.mkstemp(
+                dir=target.parent,
+                prefix=f".{target.name}.",
+                suffix=".tmp",
+            )
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            if mode is not None:
+                os.chmod(tmp_path, mode)
+            os.replace(tmp_path, target)
+        except OSError as e:
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
             raise RuntimeError(f"Failed to save config to {self.config_path}: {e}")
+        self._dirty = False
+        self._loaded_mtime_ns = self.config_path.stat().st_mtime_ns
+        self._saved_bytes = data
+        self._invalidate_cache()
 
-    def add_profile(self, name: str, profile: ServerProfile) -> None:
-        if "profiles" not in self.config_data:
-            self.config_data["profiles"] = {}
+    def flush(self) -> None:
+        """Write the config file if there are unsaved changes"""
+        if self._dirty:
+            self.save_config()
 
-        self.config_data["profiles"][name] = profile.to_dict()
-        self.save_config()
+    def _mark_dirty(self) -> None:
+        """Record a change, saving it now unless inside a `with` block"""
+        self._dirty = True
+        if self._batch_depth == 0:
+            self.flush()
+
+    def add_profile(self, name: str, profile: ServerProfile) -> None:
+        self._profiles[name] = profile.to_dict()
+        self._profile_cache.pop(name, None)
+        self._mark_dirty()
 
     def remove_profile(self, name: str) -> bool:
-        if name in self.config_data.get("profiles", {}):
-            del self.config_data["profiles"][name]
+        if name in self._profiles:
+            del self._profiles[name]
+            self._profile_cache.pop(name, None)
 
             if self.config_data.get("current_profile") == name:
                 self.config_data["current_profile"] = None
 
-            self.save_config()
+            self._mark_dirty()
             return True
         return False
 
+    def _cached_profile(self, name: str, data: dict[str, Any]) -> ServerProfile:
+        profile = self._profile_cache.get(name)
+        if profile is None:
+            profile = self._profile_cache[name] = ServerProfile.from_dict(data)
+        return profile
+
     def get_profile(self, name: str) -> ServerProfile | None:
-        profiles = self.config_data.get("profiles", {})
-        if name in profiles:
-            return ServerProfile.from_dict(profiles[name])
-        return None
+        data = self._profiles.get(name)
+        if data is None:
+            return None
+        return self._cached_profile(name, data)
 
     def list_profiles(self) -> dict[str, ServerProfile]:
-        profiles = {}
-        for name, data in self.config_data.get("profiles", {}).items():
-            profiles[name] = ServerProfile.from_dict(data)
-        return profiles
+        return {
+            name: self._cached_profile(name, data)
+            for name, data in self._profiles.items()
+        }
 
     def set_current_profile(self, name: str) -> bool:
-        if name in self.config_data.get("profiles", {}):
+        if name in self._profiles:
             self.config_data["current_profile"] = name
-            self.save_config()
+            self._mark_dirty()
             return True
         return False
 
@@ -103,16 +304,17 @@ class ConfigManager:
         return self.config_data.get("current_profile")
 
     def update_profile(self, name: str, **kwargs) -> bool:
-        if name in self.config_data.get("profiles", {}):
-            profile_data = self.config_data["profiles"][name]
+        if name in self._profiles:
+            profile_data = self._profiles[name]
 
             for key, value in kwargs.items():
                 if value is not None:  # Only update non-None values
                     profile_data[key] = value
+            self._profile_cache.pop(name, None)
 
-            self.save_config()
+            self._mark_dirty()
             return True
         return False
 
     def expand_path(self, path: str) -> str:
-        return os.path.expanduser(path)
+        return expand_user(path)
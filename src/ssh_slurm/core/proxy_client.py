@@ -3,13 +3,15 @@ import logging
 import paramiko
 
 from .ssh_config import SSHHost, get_ssh_config_host
+from .transport import open_tuned_socket, open_tuned_transport
 
 
 class ProxySSHClient:
     """SSH Client with ProxyJump support using Paramiko"""
 
-    def __init__(self, logger: logging.Logger | None = None):
+    def __init__(self, logger: logging.Logger | None = None, compress: bool = False):
         self.logger = logger or logging.getLogger(__name__)
+        self.compress = compress
         self.proxy_client: paramiko.SSHClient | None = None
         self.proxy_transport: paramiko.Transport | None = None
 
@@ -26,6 +28,11 @@ class ProxySSHClient:
                 "hostname": proxy_host_config.effective_hostname,
                 "username": proxy_host_config.effective_user,
                 "port": proxy_host_config.effective_port,
+                "sock": open_tuned_socket(
+                    proxy_host_config.effective_hostname,
+                    proxy_host_config.effective_port,
+                ),
+                "transport_factory": open_tuned_transport,
             }
 
             if proxy_host_config.effective_identity_file:
@@ -34,7 +41,7 @@ class ProxySSHClient:
                 )
 
             self.logger.info(
-                f"Connecting to proxy host: {proxy_host_config.effective_hostname}"
+                "Connecting to proxy host: %s", proxy_host_config.effective_hostname
             )
             self.proxy_client.connect(**proxy_connect_kwargs)
 
@@ -44,11 +51,11 @@ class ProxySSHClient:
                 "direct-tcpip", (target_host, target_port), ("", 0)
             )
 
-            self.logger.info(f"Created proxy channel to {target_host}:{target_port}")
+            self.logger.info("Created proxy channel to %s:%s", target_host, target_port)
             return proxy_channel
 
         except Exception as e:
-            self.logger.error(f"Failed to create proxy connection: {e}")
+            self.logger.error("Failed to create proxy connection: %s", e)
             self.close_proxy()
             raise
 
@@ -92,7 +99,10 @@ class ProxySSHClient:
         target_client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
 
         # Create transport over proxy channel
-        target_transport = paramiko.Transport(proxy_channel)
+        target_transport = open_tuned_transport(proxy_channel)
+        # Only the end-to-end transport is compressed; the jump host hop
+        # carries its already-compressed packets
+        target_transport.use_compression(self.compress)
         target_transport.start_client()
 
         # Authenticate with target host
@@ -135,7 +145,9 @@ class ProxySSHClient:
         target_client._transport = target_transport
 
         self.logger.info(
-            f"Successfully connected to {target_host_config.effective_hostname} through {proxy_host_name}"
+            "Successfully connected to %s through %s",
+            target_host_config.effective_hostname,
+            proxy_host_name,
         )
         return target_client, proxy_channel
 
@@ -148,6 +160,7 @@ def create_proxy_aware_connection(
     proxy_jump: str | None = None,
     ssh_config_path: str | None = None,
     logger: logging.Logger | None = None,
+    compress: bool = False,
 ) -> tuple[paramiko.SSHClient, ProxySSHClient | None]:
     """Create SSH connection with optional ProxyJump support"""
 
@@ -156,7 +169,13 @@ def create_proxy_aware_connection(
         client = paramiko.SSHClient()
         client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
         client.connect(
-            hostname=hostname, username=username, key_filename=key_filename, port=port
+            hostname=hostname,
+            username=username,
+            key_filename=key_filename,
+            port=port,
+            sock=open_tuned_socket(hostname, port),
+            transport_factory=open_tuned_transport,
+            compress=compress,
         )
         return client, None
 
@@ -167,7 +186,7 @@ def create_proxy_aware_connection(
         hostname=hostname, user=username, port=port, identity_file=key_filename
     )
 
-    proxy_client = ProxySSHClient(logger)
+    proxy_client = ProxySSHClient(logger, compress=compress)
     ssh_client, _ = proxy_client.connect_through_proxy(
         target_host_config, proxy_jump, ssh_config_path
     )
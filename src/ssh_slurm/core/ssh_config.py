@@ -1,7 +1,65 @@
+import functools
 import os
 import re
+from collections.abc import Callable
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Any
+
+# "Keyword value" lines of an ssh_config file, matched across the whole file
+# in one scan; blank and comment lines never match
+CONFIG_LINE_RE = re.compile(r"^[^\S\n]*(\w+)[^\S\n]+(.*?\S)[^\S\n]*$", re.MULTILINE)
+
+
+# Tokens expanded in HostName values
+HOSTNAME_TOKEN_RE = re.compile(r"%[h%]")
+
+# Key files ssh tries when no IdentityFile is configured, in order of preference
+DEFAULT_IDENTITY_FILES = ("id_rsa", "id_ed25519", "id_ecdsa", "id_dsa")
+
+# ForwardAgent values that enable it
+_TRUE_VALUES = frozenset(("yes", "true", "1"))
+
+
+def _parse_int(value: str) -> int | None:
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+def _parse_bool(value: str) -> bool:
+    return value.lower() in _TRUE_VALUES
+
+
+# Lowercased config keyword -> (SSHHost field, value parser)
+_HOST_FIELDS: dict[str, tuple[str, Callable[[str], Any]]] = {
+    "hostname": ("hostname", str),
+    "user": ("user", str),
+    "port": ("port", _parse_int),
+    "identityfile": ("identity_file", str),
+    "proxycommand": ("proxy_command", str),
+    "proxyjump": ("proxy_jump", str),
+    "forwardagent": ("forward_agent", _parse_bool),
+}
+
+
+def expand_user(path: str) -> str:
+    """os.path.expanduser, cached per path and $HOME value"""
+    if not path.startswith("~"):
+        return path
+    return _expand_user(path, os.environ.get("HOME"))
+
+
+@functools.lru_cache(maxsize=256)
+def _expand_user(path: str, home: str | None) -> str:
+    # home is only part of the cache key; expanduser reads it from os.environ
+    return os.path.expanduser(path)
+
+
+def _pattern_to_regex(pattern: str) -> str:
+    """Translate an SSH host pattern (`*` and `?` wildcards) to a regex"""
+    return re.escape(pattern).replace(r"\*", ".*").replace(r"\?", ".")
 
 
 @dataclass
@@ -13,23 +71,32 @@ class SSHHost:
     proxy_command: str | None = None
     proxy_jump: str | None = None
     forward_agent: bool | None = None
+    alias: str | None = None  # Name the host was looked up by, for %h
 
     @property
     def effective_hostname(self) -> str:
-        return self.hostname
+        """HostName with the %h and %% tokens expanded, as ssh does"""
+        alias = self.alias
+        if alias is None or "%" not in self.hostname:
+            return self.hostname
+        return HOSTNAME_TOKEN_RE.sub(
+            lambda m: alias if m.group() == "%h" else "%", self.hostname
+        )
 
     @property
     def effective_user(self) -> str | None:
         return self.user
 
-    @property
+    # Derived values are computed once per instance; hosts are not modified
+    # after parsing
+    @functools.cached_property
     def effective_port(self) -> int:
         return self.port or 22
 
-    @property
+    @functools.cached_property
     def effective_identity_file(self) -> str | None:
         if self.identity_file:
-            return os.path.expanduser(self.identity_file)
+            return expand_user(self.identity_file)
         return None
 
 
@@ -40,34 +107,22 @@ class SSHConfigParser:
         )
         self.hosts: dict[str, SSHHost] = {}
         self._parse()
+        self._compile_patterns()
 
     def _parse(self) -> None:
         if not self.config_path.exists():
             return
 
         try:
-            with open(self.config_path, "r") as f:
-                content = f.read()
+            content = self.config_path.read_text()
         except IOError:
             return
 
         current_host = None
         current_config: dict[str, str] = {}
 
-        for line in content.split("\n"):
-            line = line.strip()
-
-            # Skip comments and empty lines
-            if not line or line.startswith("#"):
-                continue
-
-            # Parse key-value pairs
-            match = re.match(r"(\w+)\s+(.+)", line, re.IGNORECASE)
-            if not match:
-                continue
-
-            key = match.group(1).lower()
-            value = match.group(2).strip()
+        for key, value in CONFIG_LINE_RE.findall(content):
+            key = key.lower()
 
             if key == "host":
                 # Save previous host config
@@ -79,40 +134,48 @@ class SSHConfigParser:
                 # Start new host
                 current_host = value
                 current_config = {}
-            elif current_host:
+            elif current_host and key in _HOST_FIELDS:
                 current_config[key] = value
 
         # Save last host
         if current_host:
             self.hosts[current_host] = self._create_host(current_host, current_config)
 
+    def _compile_patterns(self) -> None:
+        """Combine the wildcard host patterns into a single alternation regex
+
+        Each pattern becomes one capturing group, in config order, so the index
+        of the group that matched identifies the first matching Host entry.
+        """
+        self._wildcard_hosts = [
+            (pattern, host)
+            for pattern, host in self.hosts.items()
+            if "*" in pattern or "?" in pattern
+        ]
+        self._wildcard_re = (
+            re.compile(
+                "|".join(
+                    f"({_pattern_to_regex(pattern)})"
+                    for pattern, _host in self._wildcard_hosts
+                ),
+                re.IGNORECASE,
+            )
+            if self._wildcard_hosts
+            else None
+        )
+
     def _create_host(self, host_pattern: str, config: dict[str, str]) -> SSHHost:
+        fields = {}
+        for key, value in config.items():
+            field = _HOST_FIELDS.get(key)
+            if field:
+                name, parse = field
+                fields[name] = parse(value)
+
         # For specific hosts, use HostName if specified, otherwise use the host pattern
         # For wildcard patterns (*), always use the provided hostname when querying
-        hostname = config.get("hostname", host_pattern)
-
-        # Parse port
-        port = None
-        if "port" in config:
-            try:
-                port = int(config["port"])
-            except ValueError:
-                pass
-
-        # Parse boolean values
-        forward_agent = None
-        if "forwardagent" in config:
-            forward_agent = config["forwardagent"].lower() in ("yes", "true", "1")
-
-        return SSHHost(
-            hostname=hostname,
-            user=config.get("user"),
-            port=port,
-            identity_file=config.get("identityfile"),
-            proxy_command=config.get("proxycommand"),
-            proxy_jump=config.get("proxyjump"),
-            forward_agent=forward_agent,
-        )
+        fields.setdefault("hostname", host_pattern)
+        return SSHHost(alias=host_pattern, **fields)
 
     def get_host(self, host_pattern: str) -> SSHHost | None:
         """Get host configuration by exact match or pattern matching"""
@@ -120,36 +183,34 @@ class SSHConfigParser:
         if host_pattern in self.hosts:
             return self.hosts[host_pattern]
 
-        # Then try pattern matching
-        for pattern, host in self.hosts.items():
-            if self._match_pattern(pattern, host_pattern):
-                # Create a copy with the actual hostname
-                return SSHHost(
-                    hostname=host.hostname
-                    if host.hostname != pattern
-                    else host_pattern,
-                    user=host.user,
-                    port=host.port,
-                    identity_file=host.identity_file,
-                    proxy_command=host.proxy_command,
-                    proxy_jump=host.proxy_jump,
-                    forward_agent=host.forward_agent,
-                )
-
-        return None
+        # Then try pattern matching (patterns without wildcards only match
+        # exactly, which was handled above)
+        if self._wildcard_re is None:
+            return None
+        match = self._wildcard_re.fullmatch(host_pattern)
+        # Every alternative is a group, so a match always sets lastindex
+        if not match or match.lastindex is None:
+            return None
+
+        pattern, host = self._wildcard_hosts[match.lastindex - 1]
+        # Create a copy with the actual hostname
+        return SSHHost(
+            hostname=host.hostname if host.hostname != pattern else host_pattern,
+            user=host.user,
+            port=host.port,
+            identity_file=host.identity_file,
+            proxy_command=host.proxy_command,
+            proxy_jump=host.proxy_jump,
+            forward_agent=host.forward_agent,
+            alias=host_pattern,
+        )
 
     def _match_pattern(self, pattern: str, hostname: str) -> bool:
         """Simple pattern matching for SSH host patterns"""
         if "*" not in pattern and "?" not in pattern:
             return pattern == hostname
 
-        # Convert SSH pattern to regex
-        regex_pattern = pattern.replace(".", r"\.")
-        regex_pattern = regex_pattern.replace("*", ".*")
-        regex_pattern = regex_pattern.replace("?", ".")
-        regex_pattern = f"^{regex_pattern}$"
-
-        return bool(re.match(regex_pattern, hostname, re.IGNORECASE))
+        return bool(re.fullmatch(_pattern_to_regex(pattern), hostname, re.IGNORECASE))
 
     def list_hosts(self) -> dict[str, SSHHost]:
         """List all configured hosts"""
@@ -163,25 +224,48 @@ class SSHConfigParser:
         if host and host.effective_identity_file:
             files.append(host.effective_identity_file)
 
-        # Add default identity files if none specified
+        # Add default identity files if none specified, listing ~/.ssh once
+        # instead of checking each candidate
         if not files:
-            default_keys = [
-                "~/.ssh/id_rsa",
-                "~/.ssh/id_ed25519",
-                "~/.ssh/id_ecdsa",
-                "~/.ssh/id_dsa",
+            ssh_dir = expand_user("~/.ssh")
+            try:
+                with os.scandir(ssh_dir) as entries:
+                    present = {entry.name for entry in entries}
+            except OSError:
+                present = set()
+            files = [
+                os.path.join(ssh_dir, name)
+                for name in DEFAULT_IDENTITY_FILES
+                if name in present
             ]
-            for key in default_keys:
-                key_path = os.path.expanduser(key)
-                if os.path.exists(key_path):
-                    files.append(key_path)
 
         return files
 
 
+# Parsed configs by path, with the (mtime_ns, size) they were parsed at
+_parser_cache: dict[Path, tuple[tuple[int, int] | None, SSHConfigParser]] = {}
+
+
+def _get_parser(config_path: str | None = None) -> SSHConfigParser:
+    """Return a parser for config_path, reusing it while the file is unchanged"""
+    path = Path(config_path) if config_path else Path.home() / ".ssh" / "config"
+    try:
+        st = path.stat()
+        version = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        version = None
+
+    cached = _parser_cache.get(path)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    parser = SSHConfigParser(str(path))
+    _parser_cache[path] = (version, parser)
+    return parser
+
+
 def get_ssh_config_host(
     hostname: str, config_path: str | None = None
 ) -> SSHHost | None:
     """Convenience function to get host configuration"""
-    parser = SSHConfigParser(config_path)
-    return parser.get_host(hostname)
+    return _get_parser(config_path).get_host(hostname)
@@ -0,0 +1,63 @@
+import socket
+
+import paramiko
+
+# Kernel socket buffer size requested for SSH connections. Large buffers let
+# the TCP window grow on high bandwidth-delay links (the kernel clamps the
+# value to net.core.{r,w}mem_max).
+SOCKET_BUFFER_SIZE = 32 * 1024 * 1024
+
+# SSH channel flow control. paramiko's 2 MiB default window stalls SFTP
+# transfers waiting for window adjusts on any non-trivial RTT.
+WINDOW_SIZE = 2**31 - 1
+MAX_PACKET_SIZE = 32768 * 8
+
+# Bytes sent/received before paramiko renegotiates keys (default 512 MiB);
+# raised so that large transfers are not paused by a mid-stream rekey
+REKEY_BYTES = 2**40
+
+
+def open_tuned_socket(
+    hostname: str, port: int, timeout: float | None = None
+) -> socket.socket:
+    """Open a TCP connection with Nagle disabled and large socket buffers
+
+    The returned socket is meant to be passed as ``sock=`` to
+    ``paramiko.SSHClient.connect``. Buffer sizes are set before connecting so
+    that the window scale negotiated in the handshake can use them.
+    """
+    last_error: OSError | None = None
+    for family, socktype, proto, _canonname, address in socket.getaddrinfo(
+        hostname, port, type=socket.SOCK_STREAM
+    ):
+        sock = socket.socket(family, socktype, proto)
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_BUFFER_SIZE)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_BUFFER_SIZE)
+            sock.settimeout(timeout)
+            sock.connect(address)
+            return sock
+        except OSError as e:
+            sock.close()
+            last_error = e
+
+    raise last_error or OSError(f"Could not resolve {hostname}:{port}")
+
+
+def open_tuned_transport(sock, **kwargs) -> paramiko.Transport:
+    """Create a Transport with a large channel window and packet size
+
+    Matches the ``transport_factory`` signature of
+    ``paramiko.SSHClient.connect``; channels opened on the transport
+    (including the SFTP session) inherit the window settings.
+    """
+    transport = paramiko.Transport(
+        sock,
+        default_window_size=WINDOW_SIZE,
+        default_max_packet_size=MAX_PACKET_SIZE,
+        **kwargs,
+    )
+    transport.packetizer.REKEY_BYTES = REKEY_BYTES
+    transport.packetizer.REKEY_BYTES_OVERFLOW_MAX = REKEY_BYTES
+    return transport
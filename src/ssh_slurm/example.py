@@ -41,6 +41,8 @@ echo "Job completed at $(date)"
             if stderr:
                 print(f"Job errors:\n{stderr}")
 
+            client.cleanup_job_files(job)
+
 
 if __name__ == "__main__":
     main()
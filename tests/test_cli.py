@@ -0,0 +1,218 @@
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from ssh_slurm.cli import main as cli_main
+from ssh_slurm.cli.main import (
+    _HELP,
+    _PROFILE_HELP,
+    _PROFILE_SCHEMA,
+    _build_profile_parser,
+)
+from ssh_slurm.cli.parsing import parse_static
+from ssh_slurm.cli.submit import _build_parser, _fast_parse, _params_from_ssh_host
+
+
+class TestPrerenderedHelp:
+    def test_help_lists_every_submit_option(self):
+        parser = _build_parser(grouped=True)
+        for action in parser._actions:
+            for option in action.option_strings:
+                assert option in _HELP
+            if action.help:
+                assert action.help.split()[0] in _HELP
+
+    def test_profile_help_lists_every_subcommand(self):
+        parser = _build_profile_parser([])
+        for action in parser._actions:
+            for option in action.option_strings:
+                assert option in _PROFILE_HELP
+            for choice in getattr(action, "choices", None) or {}:
+                assert choice in _PROFILE_HELP
+
+    @pytest.mark.skipif(
+        sys.version_info < (3, 13), reason="_HELP is rendered by Python 3.13+"
+    )
+    def test_help_matches_argparse(self, monkeypatch):
+        monkeypatch.setenv("COLUMNS", "80")
+        monkeypatch.setattr(sys, "argv", ["ssb"])
+
+        assert _build_parser(grouped=True).format_help() == _HELP
+
+    def test_profile_help_matches_argparse(self, monkeypatch):
+        monkeypatch.setenv("COLUMNS", "80")
+
+        assert _build_profile_parser([]).format_help() == _PROFILE_HELP
+
+    @pytest.mark.parametrize("flag", ["-h", "--help"])
+    def test_main_writes_help_without_argparse(self, flag, capsys):
+        with (
+            patch.object(cli_main, "_HELP_IS_CURRENT", True),
+            patch.object(sys, "argv", ["ssb", flag]),
+            patch.object(cli_main, "_build_profile_parser") as mock_build,
+        ):
+            cli_main.main()
+            mock_build.assert_not_called()
+
+        assert capsys.readouterr().out == _HELP
+
+    def test_main_writes_profile_help(self, capsys):
+        with patch.object(sys, "argv", ["ssb", "profile", "--help"]):
+            cli_main.main()
+
+        assert capsys.readouterr().out == _PROFILE_HELP
+
+
+class TestStaticParsing:
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            "script.sh",
+            "script.sh -H host -v --env A=1 --env=B=2 --poll-interval=5 --no-monitor",
+            "-p prof script.sh --timeout 30 --env-local KEY -i 3",
+        ],
+    )
+    def test_submit_matches_argparse(self, argv):
+        args = argv.split()
+        fast = _fast_parse(args)
+
+        assert fast is not None
+        assert vars(fast) == vars(_build_parser().parse_args(args))
+
+    @pytest.mark.parametrize(
+        "argv",
+        ["--help", "script.sh --bogus", "script.sh --port abc", "", "a b", "s --job x"],
+    )
+    def test_submit_defers_to_argparse(self, argv):
+        assert _fast_parse(argv.split()) is None
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            "",
+            "list",
+            "--config cfg.json list",
+            "add name --hostname h --username u --key-file k --port 2",
+            "add name --ssh-host dgx --description desc",
+            "remove name",
+            "show",
+            "show name",
+            "update name --port 3 --hostname=new",
+            "env name",
+            "env name set KEY VALUE",
+            "env name unset KEY",
+            "env name list",
+        ],
+    )
+    def test_profile_matches_argparse(self, argv):
+        args = argv.split()
+        fast = parse_static(args, _PROFILE_SCHEMA)
+
+        assert fast == vars(_build_profile_parser(args).parse_args(args))
+
+    @pytest.mark.parametrize(
+        "argv", ["add", "add -h", "env name set KEY", "list extra", "bogus"]
+    )
+    def test_profile_defers_to_argparse(self, argv):
+        assert parse_static(argv.split(), _PROFILE_SCHEMA) is None
+
+
+class TestLazyProfileParser:
+    @staticmethod
+    def _choices(parser):
+        for action in parser._actions:
+            if action.choices:
+                return action.choices
+        return {}
+
+    @pytest.mark.parametrize("command", ["add", "remove", "list", "set", "show"])
+    def test_non_env_command_builds_single_subparser(self, command):
+        parser = _build_profile_parser([command])
+
+        assert list(self._choices(parser)) == [command]
+
+    def test_env_command_builds_only_requested_env_subparser(self):
+        parser = _build_profile_parser(["env", "name", "unset", "KEY"])
+        env_parser = self._choices(parser)["env"]
+
+        assert list(self._choices(parser)) == ["env"]
+        assert list(self._choices(env_parser)) == ["unset"]
+
+    @pytest.mark.parametrize(
+        "argv", [["-h"], ["-h", "add"], ["add", "--help"], ["env", "name", "-h"]]
+    )
+    def test_help_builds_every_subparser(self, argv):
+        parser = _build_profile_parser(argv)
+        env_parser = self._choices(parser)["env"]
+
+        assert set(self._choices(parser)) == {
+            "add",
+            "remove",
+            "list",
+            "set",
+            "show",
+            "update",
+            "env",
+        }
+        assert set(self._choices(env_parser)) == {"set", "unset", "list"}
+
+    def test_help_before_subcommand_lists_every_choice(self, monkeypatch):
+        monkeypatch.setenv("COLUMNS", "80")
+        parser = _build_profile_parser(["-h", "add"])
+
+        assert parser.format_usage() == (
+            "usage: ssb profile [-h] [--config CONFIG]\n"
+            "                   {add,remove,list,set,show,update,env} ...\n"
+        )
+
+
+class TestHotPathSkipsArgparse:
+    def test_profile_command_does_not_build_parser(self):
+        with (
+            patch.object(sys, "argv", ["ssb", "profile", "list"]),
+            patch.object(cli_main, "_build_profile_parser") as mock_build,
+            patch("ssh_slurm.cli.profile.handle_profile_command") as mock_handle,
+        ):
+            cli_main.main()
+
+        mock_build.assert_not_called()
+        assert mock_handle.call_args.args[0].profile_command == "list"
+
+    def test_submit_does_not_build_parser(self, tmp_path):
+        argv = [
+            "ssb",
+            "job.sh",
+            "--config",
+            str(tmp_path / "config.json"),
+            "--hostname",
+            "example.com",
+            "--username",
+            "user",
+            "--key-file",
+            str(tmp_path / "missing_key"),
+        ]
+        with (
+            patch.object(sys, "argv", argv),
+            patch("ssh_slurm.cli.submit._build_parser") as mock_build,
+            pytest.raises(SystemExit),
+        ):
+            cli_main.main()
+
+        mock_build.assert_not_called()
+
+
+class TestSSHHostLookup:
+    def test_sees_edits_to_ssh_config(self, tmp_path):
+        ssh_config = tmp_path / "config"
+        ssh_config.write_text("Host cluster\n    HostName old.example.com\n")
+        assert (
+            _params_from_ssh_host("cluster", str(ssh_config))["hostname"]
+            == "old.example.com"
+        )
+
+        ssh_config.write_text("Host cluster\n    HostName login.example.org\n")
+        assert (
+            _params_from_ssh_host("cluster", str(ssh_config))["hostname"]
+            == "login.example.org"
+        )
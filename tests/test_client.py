@@ -0,0 +1,333 @@
+import asyncio
+import shlex
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from ssh_slurm.core.client import LOG_SEPARATOR, SlurmJob, SSHSlurmClient
+
+
+@pytest.fixture
+def client():
+    return SSHSlurmClient(hostname="example.com", username="testuser")
+
+
+def _log_entry(state: str, path: str, content: bytes = b"") -> bytes:
+    """One file as printed by the get_job_output search script"""
+    return f"\n{LOG_SEPARATOR} {state} {path}\n".encode() + content
+
+
+class TestExecuteScript:
+    def test_script_passed_as_argument_not_stdin(self, client):
+        channel = MagicMock()
+        stdin, stdout = MagicMock(), MagicMock()
+        stdin.channel = stdout.channel = channel
+        client.ssh_client = MagicMock()
+        client.ssh_client.exec_command.return_value = (stdin, stdout, MagicMock())
+        script = "read line\necho 'done'\n"
+
+        with patch(
+            "ssh_slurm.core.client._drain_channel", return_value=(b"done\n", b"", 0)
+        ):
+            result = client.execute_script(script)
+
+        assert result == ("done\n", "", 0)
+        command = client.ssh_client.exec_command.call_args.args[0]
+        assert shlex.split(command) == ["bash", "-l", "-c", script]
+        stdin.write.assert_not_called()
+        channel.shutdown_write.assert_called_once()
+
+
+class TestValidateRemoteScript:
+    def test_checks_found_after_login_banner(self, client):
+        banner = b"Welcome to the cluster\nMOTD=maintenance\n\nLast login: today\n"
+        stdout = banner + b"F=1\nR=1\nX=1\nSZ=120\nSYN=0\n"
+
+        with patch.object(
+            client, "execute_command_bytes", return_value=(stdout, b"", 0)
+        ):
+            assert client.validate_remote_script("/home/u/job.sh") == (
+                True,
+                "Script validation successful",
+            )
+
+    def test_reports_syntax_errors(self, client):
+        stdout = (
+            b"F=1\nR=1\nX=1\nSZ=120\n"
+            b"/home/u/job.sh: line 3: syntax error: unexpected end of file\nSYN=2\n"
+        )
+
+        with patch.object(
+            client, "execute_command_bytes", return_value=(stdout, b"", 0)
+        ):
+            valid, message = client.validate_remote_script("/home/u/job.sh")
+
+        assert not valid
+        assert message.endswith("line 3: syntax error: unexpected end of file")
+
+    def test_missing_file(self, client):
+        stdout = b"F=0\nR=0\nX=0\nSZ=0\nSYN=1\n"
+
+        with patch.object(
+            client, "execute_command_bytes", return_value=(stdout, b"", 0)
+        ):
+            valid, message = client.validate_remote_script("/home/u/job.sh")
+
+        assert not valid
+        assert message == "Remote script file not found: /home/u/job.sh"
+
+
+class TestGetJobOutput:
+    def test_reads_primary_and_error_files(self, client):
+        stdout = (
+            _log_entry("R", "/logs/train_42.log", b"step 1\nstep 2\n")
+            + _log_entry("S", "/logs/other_42.log")
+            + _log_entry("R", "/logs/slurm-42.err", b"warning\n")
+        )
+
+        with patch.object(
+            client, "execute_command_bytes", return_value=(stdout, b"", 0)
+        ) as mock_exec:
+            output, error = client.get_job_output("42", "train")
+
+        assert output == "step 1\nstep 2\n"
+        assert error == "warning\n"
+        mock_exec.assert_called_once()
+
+    def test_invalid_utf8_is_replaced_per_file(self, client):
+        stdout = _log_entry("R", "/logs/slurm-42.out", b"ok\n") + _log_entry(
+            "R", "/logs/slurm-42.err", b"bad \xff byte\n"
+        )
+
+        with patch.object(
+            client, "execute_command_bytes", return_value=(stdout, b"", 0)
+        ):
+            output, error = client.get_job_output("42")
+
+        assert output == "ok\n"
+        assert error == "bad � byte\n"
+
+    def test_unreadable_primary_log(self, client):
+        stdout = _log_entry("U", "/logs/slurm-42.out")
+
+        with patch.object(
+            client, "execute_command_bytes", return_value=(stdout, b"", 0)
+        ):
+            output, error = client.get_job_output("42")
+
+        assert output == "Could not read log file\n"
+        assert error == ""
+
+    def test_falls_back_to_default_files(self, client):
+        with (
+            patch.object(client, "execute_command_bytes", return_value=(b"", b"", 0)),
+            patch.object(
+                client, "_read_remote_file", side_effect=["out\n", "err\n"]
+            ) as mock_read,
+        ):
+            output, error = client.get_job_output("42")
+
+        assert (output, error) == ("out\n", "err\n")
+        assert [call.args[0] for call in mock_read.call_args_list] == [
+            "slurm-42.out",
+            "slurm-42.err",
+        ]
+
+
+def _slurm_responses(squeue: str = "", sacct: str = "", sacct_exit: int = 0):
+    """Stub for _execute_slurm_command answering squeue and sacct"""
+
+    def execute(command):
+        if command.startswith("squeue"):
+            return squeue, "", 0
+        return sacct, "", sacct_exit
+
+    return execute
+
+
+class TestGetJobStatuses:
+    def test_parses_squeue_and_sacct(self, client):
+        execute = _slurm_responses(
+            squeue="41 RUNNING\n",
+            sacct="42|COMPLETED\n42.batch|COMPLETED\n42.extern|COMPLETED\n",
+        )
+
+        with patch.object(
+            client, "_execute_slurm_command", side_effect=execute
+        ) as mock_exec:
+            statuses = client.get_job_statuses(["41", "42"])
+
+        assert statuses == {"41": "RUNNING", "42": "COMPLETED"}
+        commands = [call.args[0] for call in mock_exec.call_args_list]
+        assert commands[0] == "squeue -j 41,42 -h -o '%i %T'"
+        assert commands[1].startswith("sacct -j 42 ")
+
+    def test_sacct_allocation_row_wins_over_steps(self, client):
+        execute = _slurm_responses(
+            sacct="43|TIMEOUT\n43.batch|CANCELLED\n43.0|FAILED\n"
+        )
+
+        with patch.object(client, "_execute_slurm_command", side_effect=execute):
+            assert client.get_job_status("43") == "TIMEOUT"
+
+    def test_sacct_state_qualifiers_are_dropped(self, client):
+        execute = _slurm_responses(
+            sacct="46|CANCELLED by 1234\n46.batch|CANCELLED\n47|OUT_OF_MEMORY\n"
+        )
+
+        with patch.object(client, "_execute_slurm_command", side_effect=execute):
+            statuses = client.get_job_statuses(["46", "47"])
+
+        assert statuses == {"46": "CANCELLED", "47": "OUT_OF_MEMORY"}
+
+    def test_sacct_skipped_when_squeue_finds_all(self, client):
+        execute = _slurm_responses(squeue="41 PENDING\n")
+
+        with patch.object(
+            client, "_execute_slurm_command", side_effect=execute
+        ) as mock_exec:
+            assert client.get_job_status("41") == "PENDING"
+
+        mock_exec.assert_called_once()
+
+    def test_unknown_job_is_not_found(self, client):
+        with patch.object(
+            client, "_execute_slurm_command", side_effect=_slurm_responses()
+        ):
+            assert client.get_job_status("44") == "NOT_FOUND"
+
+    def test_failed_sacct_is_not_found(self, client):
+        execute = _slurm_responses(sacct="44|COMPLETED\n", sacct_exit=1)
+
+        with patch.object(client, "_execute_slurm_command", side_effect=execute):
+            assert client.get_job_status("44") == "NOT_FOUND"
+
+    def test_command_error_is_not_cached(self, client):
+        with (
+            patch("ssh_slurm.core.client.time.monotonic", return_value=0.0),
+            patch.object(
+                client,
+                "_execute_slurm_command",
+                side_effect=[OSError("connection lost"), ("45 RUNNING\n", "", 0)],
+            ),
+        ):
+            assert client.get_job_status("45") == "ERROR"
+            assert client.get_job_status("45") == "RUNNING"
+
+    def test_running_status_cached_for_ttl(self, client):
+        execute = _slurm_responses(squeue="41 RUNNING\n")
+
+        with (
+            patch("ssh_slurm.core.client.time.monotonic", side_effect=[0.0, 0.1, 1.0]),
+            patch.object(
+                client, "_execute_slurm_command", side_effect=execute
+            ) as mock_exec,
+        ):
+            for _ in range(3):
+                assert client.get_job_status("41") == "RUNNING"
+
+        assert mock_exec.call_count == 2
+
+    def test_final_status_cached_forever(self, client):
+        execute = _slurm_responses(sacct="42|COMPLETED\n")
+
+        with (
+            patch("ssh_slurm.core.client.time.monotonic", side_effect=[0.0, 3600.0]),
+            patch.object(
+                client, "_execute_slurm_command", side_effect=execute
+            ) as mock_exec,
+        ):
+            assert client.get_job_status("42") == "COMPLETED"
+            assert client.get_job_status("42") == "COMPLETED"
+
+        assert mock_exec.call_count == 2  # squeue + sacct, first call only
+
+    def test_not_found_is_refetched_after_ttl(self, client):
+        execute = _slurm_responses()
+
+        with (
+            patch("ssh_slurm.core.client.time.monotonic", side_effect=[0.0, 3600.0]),
+            patch.object(
+                client, "_execute_slurm_command", side_effect=execute
+            ) as mock_exec,
+        ):
+            assert client.get_job_status("44") == "NOT_FOUND"
+            assert client.get_job_status("44") == "NOT_FOUND"
+
+        assert mock_exec.call_count == 4
+
+
+class TestMonitorJobs:
+    def test_monitor_job_polls_until_finished(self, client):
+        job = SlurmJob(job_id="42", name="train")
+        polls = [{"42": "PENDING"}, {"42": "RUNNING"}, {"42": "COMPLETED"}]
+
+        with (
+            patch.object(client, "get_job_statuses", side_effect=polls),
+            patch("ssh_slurm.core.client.time.sleep") as mock_sleep,
+        ):
+            result = client.monitor_job(job, poll_interval=10)
+
+        assert result is job
+        assert job.status == "COMPLETED"
+        assert mock_sleep.call_count == 2
+
+    def test_monitor_job_inside_running_event_loop(self, client):
+        job = SlurmJob(job_id="42", name="train")
+
+        async def run_in_loop():
+            return client.monitor_job(job)
+
+        with patch.object(client, "get_job_statuses", return_value={"42": "COMPLETED"}):
+            result = asyncio.run(run_in_loop())
+
+        assert result.status == "COMPLETED"
+
+    def test_backoff_resets_on_status_change(self, client):
+        job = SlurmJob(job_id="42", name="train")
+        polls = [
+            {"42": state}
+            for state in ["PENDING", "PENDING", "PENDING", "RUNNING", "RUNNING"]
+        ] + [{"42": "COMPLETED"}]
+
+        with (
+            patch.object(client, "get_job_statuses", side_effect=polls),
+            patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+        ):
+            asyncio.run(
+                client.monitor_job_async(
+                    job, poll_interval=10, initial_interval=1.0, backoff=2.0
+                )
+            )
+
+        intervals = [call.args[0] for call in mock_sleep.call_args_list]
+        assert intervals == [1.0, 2.0, 4.0, 1.0, 2.0]
+        assert job.status == "COMPLETED"
+
+    def test_backoff_capped_at_poll_interval(self, client):
+        job = SlurmJob(job_id="42", name="train", status="RUNNING")
+        polls = [{"42": "RUNNING"}] * 5 + [{"42": "FAILED"}]
+
+        with (
+            patch.object(client, "get_job_statuses", side_effect=polls),
+            patch("ssh_slurm.core.client.time.sleep") as mock_sleep,
+        ):
+            client.monitor_job(job, poll_interval=5, initial_interval=1.0)
+
+        intervals = [call.args[0] for call in mock_sleep.call_args_list]
+        assert intervals == [1.0, 2.0, 4.0, 5, 5]
+
+    def test_stops_on_qualified_and_uncommon_final_states(self, client):
+        jobs = [SlurmJob(job_id="46", name="a"), SlurmJob(job_id="47", name="b")]
+        execute = _slurm_responses(
+            sacct="46|CANCELLED by 1234\n47|OUT_OF_MEMORY\n47.batch|OUT_OF_MEMORY\n"
+        )
+
+        with (
+            patch.object(client, "_execute_slurm_command", side_effect=execute),
+            patch("ssh_slurm.core.client.time.sleep") as mock_sleep,
+        ):
+            client.monitor_jobs(jobs)
+
+        assert [job.status for job in jobs] == ["CANCELLED", "OUT_OF_MEMORY"]
+        mock_sleep.assert_not_called()
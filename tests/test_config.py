@@ -136,8 +136,8 @@ class TestConfigManager:
         expected_data = {"current_profile": None, "profiles": {}}
         assert config_manager.config_data == expected_data
 
-        # Should have created the file
-        assert os.path.exists(temp_config_file)
+        # The file is only created by the first change
+        assert not os.path.exists(temp_config_file)
 
     def test_init_with_invalid_json(self, temp_config_file):
         # Write invalid JSON to file
@@ -178,6 +178,101 @@ class TestConfigManager:
             saved_data = json.load(f)
         assert saved_data["profiles"]["new-profile"] == profile.to_dict()
 
+    def test_context_manager_saves_once(self, temp_config_file, sample_config_data):
+        with open(temp_config_file, "w") as f:
+            json.dump(sample_config_data, f)
+
+        profile = ServerProfile(
+            hostname="new.example.com",
+            username="newuser",
+            key_filename="/home/user/.ssh/new_key",
+        )
+
+        with (
+            patch.object(ConfigManager, "save_config", autospec=True) as mock_save,
+            ConfigManager(temp_config_file) as config_manager,
+        ):
+            config_manager.add_profile("new-profile", profile)
+            config_manager.set_current_profile("new-profile")
+            config_manager.update_profile("new-profile", port=2222)
+            mock_save.assert_not_called()
+
+        mock_save.assert_called_once_with(config_manager)
+
+    def test_load_config_keeps_pending_changes(
+        self, temp_config_file, sample_config_data
+    ):
+        with open(temp_config_file, "w") as f:
+            json.dump(sample_config_data, f)
+
+        profile = ServerProfile(
+            hostname="new.example.com",
+            username="newuser",
+            key_filename="/home/user/.ssh/new_key",
+        )
+
+        with ConfigManager(temp_config_file) as config_manager:
+            config_manager.add_profile("new-profile", profile)
+
+            # Another process rewrites the file while changes are pending
+            with open(temp_config_file, "w") as f:
+                json.dump({"current_profile": None, "profiles": {}}, f)
+            os.utime(temp_config_file, ns=(0, 0))
+            config_manager.load_config()
+
+            assert config_manager.get_profile("new-profile") == profile
+
+        with open(temp_config_file, "r") as f:
+            saved_data = json.load(f)
+        assert saved_data["profiles"]["new-profile"] == profile.to_dict()
+
+    def test_flush_without_changes_does_not_write(self, temp_config_file):
+        config_manager = ConfigManager(temp_config_file)
+
+        with patch.object(config_manager, "save_config") as mock_save:
+            config_manager.flush()
+            mock_save.assert_not_called()
+
+    def test_save_config_writes_through_symlink(self, tmp_path, sample_config_data):
+        target = tmp_path / "dotfiles" / "ssh-slurm.json"
+        target.parent.mkdir()
+        target.write_text(json.dumps(sample_config_data))
+        link = tmp_path / "ssh-slurm.json"
+        link.symlink_to(target)
+
+        config_manager = ConfigManager(str(link))
+        config_manager.set_current_profile("dgx-profile")
+
+        assert link.is_symlink()
+        assert json.loads(target.read_text())["current_profile"] == "dgx-profile"
+
+    def test_save_config_skips_unchanged_data(self, temp_config_file):
+        config_manager = ConfigManager(temp_config_file)
+        profile = ServerProfile(
+            hostname="new.example.com",
+            username="newuser",
+            key_filename="/home/user/.ssh/new_key",
+        )
+        config_manager.add_profile("new-profile", profile)
+
+        with patch("os.replace", wraps=os.replace) as mock_replace:
+            config_manager.set_current_profile("new-profile")
+            config_manager.set_current_profile("new-profile")
+            config_manager.update_profile("new-profile", port=22)
+            assert mock_replace.call_count == 1
+
+    def test_load_config_skips_unchanged_file(
+        self, temp_config_file, sample_config_data
+    ):
+        with open(temp_config_file, "w") as f:
+            json.dump(sample_config_data, f)
+
+        config_manager = ConfigManager(temp_config_file)
+
+        with patch("ssh_slurm.core.config._loads_json") as mock_load:
+            config_manager.load_config()
+            mock_load.assert_not_called()
+
     def test_get_profile_existing(self, temp_config_file, sample_config_data):
         with open(temp_config_file, "w") as f:
             json.dump(sample_config_data, f)
@@ -286,6 +381,22 @@ class TestConfigManager:
         # Other fields should remain unchanged
         assert profile.username == "testuser"
 
+    def test_get_profile_cached_until_update(
+        self, temp_config_file, sample_config_data
+    ):
+        with open(temp_config_file, "w") as f:
+            json.dump(sample_config_data, f)
+
+        config_manager = ConfigManager(temp_config_file)
+        profile = config_manager.get_profile("test-profile")
+        assert config_manager.get_profile("test-profile") is profile
+        assert config_manager.list_profiles()["test-profile"] is profile
+
+        config_manager.update_profile("test-profile", port=2222)
+        updated = config_manager.get_profile("test-profile")
+        assert updated is not profile
+        assert updated.port == 2222
+
     def test_update_profile_nonexistent(self, temp_config_file):
         config_manager = ConfigManager(temp_config_file)
         result = config_manager.update_profile(
@@ -304,6 +415,7 @@ class TestConfigManager:
 
     def test_save_config_error_handling(self, temp_config_file):
         config_manager = ConfigManager(temp_config_file)
+        config_manager.save_config()
 
         # Make file read-only to cause write error
         os.chmod(temp_config_file, 0o444)
@@ -318,3 +430,65 @@ class TestConfigManager:
 
         # Restore permissions for cleanup
         os.chmod(temp_config_file, 0o644)
+
+    @patch("pathlib.Path.home")
+    def test_profile_cache_is_private(
+        self, mock_home, tmp_path, temp_config_file, sample_config_data
+    ):
+        mock_home.return_value = tmp_path
+        with open(temp_config_file, "w") as f:
+            json.dump(sample_config_data, f)
+
+        config_manager = ConfigManager(temp_config_file, use_cache=True)
+
+        assert config_manager.cache_path.stat().st_mode & 0o777 == 0o600
+        assert os.listdir(config_manager.cache_path.parent) == ["profiles.pkl"]
+
+    @patch("pathlib.Path.home")
+    def test_profile_cache_hit_skips_json(
+        self, mock_home, tmp_path, temp_config_file, sample_config_data
+    ):
+        mock_home.return_value = tmp_path
+        with open(temp_config_file, "w") as f:
+            json.dump(sample_config_data, f)
+
+        # First load populates the cache
+        ConfigManager(temp_config_file, use_cache=True)
+
+        with patch("ssh_slurm.core.config._loads_json") as mock_load:
+            config_manager = ConfigManager(temp_config_file, use_cache=True)
+            mock_load.assert_not_called()
+
+        assert config_manager.config_data == sample_config_data
+
+    @patch("pathlib.Path.home")
+    def test_profile_cache_invalidated_by_mtime(
+        self, mock_home, tmp_path, temp_config_file, sample_config_data
+    ):
+        mock_home.return_value = tmp_path
+        with open(temp_config_file, "w") as f:
+            json.dump(sample_config_data, f)
+        ConfigManager(temp_config_file, use_cache=True)
+
+        sample_config_data["current_profile"] = "dgx-profile"
+        with open(temp_config_file, "w") as f:
+            json.dump(sample_config_data, f)
+        stat = os.stat(temp_config_file)
+        os.utime(temp_config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        config_manager = ConfigManager(temp_config_file, use_cache=True)
+        assert config_manager.get_current_profile_name() == "dgx-profile"
+
+    @patch("pathlib.Path.home")
+    def test_save_config_invalidates_profile_cache(
+        self, mock_home, tmp_path, temp_config_file, sample_config_data
+    ):
+        mock_home.return_value = tmp_path
+        with open(temp_config_file, "w") as f:
+            json.dump(sample_config_data, f)
+
+        config_manager = ConfigManager(temp_config_file, use_cache=True)
+        assert config_manager.cache_path.exists()
+
+        config_manager.set_current_profile("dgx-profile")
+        assert not config_manager.cache_path.exists()
@@ -1,6 +1,7 @@
 import os
 import tempfile
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import patch
 
 import pytest
@@ -255,6 +256,7 @@ Host test-numeric
         assert host.hostname == "%h.example.com"  # Pattern hostname from config
         assert host.user == "researcher"
         assert host.proxy_jump == "bastion"
+        assert host.effective_hostname == "dgx-01.example.com"
 
     def test_get_host_wildcard_fallback(self, temp_ssh_config, sample_ssh_config):
         with open(temp_ssh_config, "w") as f:
@@ -328,16 +330,23 @@ Host test-numeric
         parser = SSHConfigParser(temp_ssh_config)
 
         # Mock existing default key files
-        mock_files = ["/home/testuser/.ssh/id_rsa", "/home/testuser/.ssh/id_ed25519"]
+        mock_entries = [
+            SimpleNamespace(name="id_rsa"),
+            SimpleNamespace(name="id_ed25519"),
+            SimpleNamespace(name="known_hosts"),
+        ]
 
         with (
-            patch("os.path.exists") as mock_exists,
+            patch("os.scandir") as mock_scandir,
             patch.dict(os.environ, {"HOME": "/home/testuser"}),
         ):
-            mock_exists.side_effect = lambda path: path in mock_files
+            mock_scandir.return_value.__enter__.return_value = mock_entries
 
             files = parser.find_identity_files("unknown_host")
 
+            mock_scandir.assert_called_once_with("/home/testuser/.ssh")
+            assert len(files) == 2
+
             assert "/home/testuser/.ssh/id_rsa" in files
             assert "/home/testuser/.ssh/id_ed25519" in files
 
@@ -388,3 +397,22 @@ class TestConvenienceFunction:
     def test_get_ssh_config_host_not_found(self, temp_ssh_config):
         host = get_ssh_config_host("nonexistent", temp_ssh_config)
         assert host is None
+
+    def test_get_ssh_config_host_reuses_parser(self, temp_ssh_config):
+        with open(temp_ssh_config, "w") as f:
+            f.write("Host testhost\n    User first\n")
+
+        with patch.object(
+            SSHConfigParser, "_parse", autospec=True, wraps=SSHConfigParser._parse
+        ) as mock_parse:
+            assert get_ssh_config_host("testhost", temp_ssh_config).user == "first"
+            assert get_ssh_config_host("testhost", temp_ssh_config).user == "first"
+            assert mock_parse.call_count == 1
+
+            with open(temp_ssh_config, "w") as f:
+                f.write("Host testhost\n    User second-user\n")
+
+            assert (
+                get_ssh_config_host("testhost", temp_ssh_config).user == "second-user"
+            )
+            assert mock_parse.call_count == 2